@@ -0,0 +1,33 @@
+"""Enforce founder email and LinkedIn URL formats in the database
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_check_constraint(
+        'founders_email_fmt',
+        'founders',
+        "email IS NULL OR email ~ '^[^@]+@[^@]+\\.[^@]+$'",
+    )
+    op.create_check_constraint(
+        'founders_li_fmt',
+        'founders',
+        "linkedin_url IS NULL OR linkedin_url ~ '^https?://www\\.linkedin\\.com/'",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('founders_li_fmt', 'founders', type_='check')
+    op.drop_constraint('founders_email_fmt', 'founders', type_='check')
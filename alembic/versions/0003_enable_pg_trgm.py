@@ -0,0 +1,24 @@
+"""Enable the pg_trgm extension for trigram search indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Required by the gin_trgm_ops indexes declared on the models
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+
+def downgrade() -> None:
+    op.execute('DROP EXTENSION IF EXISTS pg_trgm')
@@ -0,0 +1,28 @@
+"""Create the founder_role enum type
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Founder.primary_role declares the type with create_type=False, so it is
+    # created once here instead of on every metadata create
+    op.execute(
+        "CREATE TYPE founder_role AS ENUM "
+        "('founder', 'co_founder', 'ceo', 'cto', 'executive', 'advisor', 'other')"
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP TYPE IF EXISTS founder_role')
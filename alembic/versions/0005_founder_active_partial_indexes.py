@@ -0,0 +1,37 @@
+"""Replace the founders is_active index with partial indexes on active rows
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_founders_active_name',
+        'founders',
+        ['last_name', 'first_name'],
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ix_founders_active_updated',
+        'founders',
+        ['updated_at'],
+        postgresql_where=sa.text('is_active'),
+    )
+    op.execute('DROP INDEX IF EXISTS ix_founders_is_active')
+
+
+def downgrade() -> None:
+    op.create_index('ix_founders_is_active', 'founders', ['is_active'])
+    op.drop_index('ix_founders_active_updated', table_name='founders')
+    op.drop_index('ix_founders_active_name', table_name='founders')
@@ -0,0 +1,32 @@
+"""Store funding round duration as a generated column
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'funding_rounds',
+        sa.Column(
+            'duration_days',
+            sa.Integer(),
+            sa.Computed('closed_date - announced_date', persisted=True),
+            nullable=True,
+            comment='Days from announcement to close, generated by the database',
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('funding_rounds', 'duration_days')
@@ -0,0 +1,40 @@
+"""Store funding round currency as CHAR(3) and enforce ISO 4217 format
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'funding_rounds',
+        'currency',
+        type_=sa.CHAR(3),
+        existing_nullable=False,
+        postgresql_using='upper(currency)::char(3)',
+    )
+    op.create_check_constraint(
+        'funding_rounds_currency_fmt',
+        'funding_rounds',
+        "currency ~ '^[A-Z]{3}$'",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('funding_rounds_currency_fmt', 'funding_rounds', type_='check')
+    op.alter_column(
+        'funding_rounds',
+        'currency',
+        type_=sa.String(3),
+        existing_nullable=False,
+    )
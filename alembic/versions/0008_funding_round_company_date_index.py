@@ -0,0 +1,33 @@
+"""Add a covering company/announced-date index on funding rounds
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_funding_rounds_company_date',
+        'funding_rounds',
+        ['company_id', sa.text('announced_date DESC NULLS LAST')],
+        postgresql_include=['round_type', 'raised_amount', 'currency'],
+    )
+    # Both are prefixes of the new index
+    op.execute('DROP INDEX IF EXISTS ix_funding_rounds_company_id')
+    op.execute('DROP INDEX IF EXISTS idx_funding_rounds_company_id')
+
+
+def downgrade() -> None:
+    op.create_index('ix_funding_rounds_company_id', 'funding_rounds', ['company_id'])
+    op.create_index('idx_funding_rounds_company_id', 'funding_rounds', ['company_id'])
+    op.drop_index('idx_funding_rounds_company_date', table_name='funding_rounds')
@@ -0,0 +1,38 @@
+"""Add amount and lead-investor indexes on investment participants
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_ip_round_amount',
+        'investment_participants',
+        ['round_id', sa.text('amount DESC NULLS LAST')],
+    )
+    op.create_index(
+        'ix_ip_round_lead',
+        'investment_participants',
+        ['round_id'],
+        postgresql_where=sa.text('is_lead'),
+    )
+    op.execute(
+        "COMMENT ON TABLE investment_participants IS 'Investor participation in funding rounds'"
+    )
+
+
+def downgrade() -> None:
+    op.execute('COMMENT ON TABLE investment_participants IS NULL')
+    op.drop_index('ix_ip_round_lead', table_name='investment_participants')
+    op.drop_index('ix_ip_round_amount', table_name='investment_participants')
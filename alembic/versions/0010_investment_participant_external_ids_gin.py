@@ -0,0 +1,29 @@
+"""Index investment participant external ids for containment lookups
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_ip_external_ids_gin',
+        'investment_participants',
+        ['external_ids'],
+        postgresql_using='gin',
+        postgresql_ops={'external_ids': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ip_external_ids_gin', table_name='investment_participants')
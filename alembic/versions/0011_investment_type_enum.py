@@ -0,0 +1,45 @@
+"""Store investment participant type as a native investment_type enum
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # InvestmentParticipant.investment_type declares the type with
+    # create_type=False, so it is created once here
+    op.execute(
+        "CREATE TYPE investment_type AS ENUM "
+        "('primary', 'secondary', 'follow_on', 'bridge', 'convertible_note', "
+        "'safe', 'kiss', 'loan', 'warrant', 'option', 'other')"
+    )
+    op.alter_column(
+        'investment_participants',
+        'investment_type',
+        type_=postgresql.ENUM(name='investment_type', create_type=False),
+        existing_type=sa.String(50),
+        existing_nullable=True,
+        postgresql_using='investment_type::investment_type',
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'investment_participants',
+        'investment_type',
+        type_=sa.String(50),
+        existing_nullable=True,
+        postgresql_using='investment_type::text',
+    )
+    op.execute('DROP TYPE IF EXISTS investment_type')
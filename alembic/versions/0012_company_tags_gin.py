@@ -0,0 +1,23 @@
+"""Index company tags for containment lookups
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0012'
+down_revision = '0011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_companies_tags', 'companies', ['tags'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_companies_tags', table_name='companies')
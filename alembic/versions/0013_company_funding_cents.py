@@ -0,0 +1,36 @@
+"""Store company funding amounts as integer cents
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16 21:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0013'
+down_revision = '0012'
+branch_labels = None
+depends_on = None
+
+# (numeric column, cents column); numeric round() rounds half away from
+# zero, matching the ROUND_HALF_UP used by ``_to_cents``
+_MONEY_COLUMNS = (
+    ('total_funding', 'total_funding_cents'),
+    ('last_funding_amount', 'last_funding_amount_cents'),
+)
+
+
+def upgrade() -> None:
+    for amount, cents in _MONEY_COLUMNS:
+        op.add_column('companies', sa.Column(cents, sa.BigInteger(), nullable=True))
+        op.execute(f'UPDATE companies SET {cents} = round({amount} * 100) WHERE {amount} IS NOT NULL')
+        op.drop_column('companies', amount)
+
+
+def downgrade() -> None:
+    for amount, cents in _MONEY_COLUMNS:
+        op.add_column('companies', sa.Column(amount, sa.Numeric(precision=15, scale=2), nullable=True))
+        op.execute(f'UPDATE companies SET {amount} = {cents} / 100.0 WHERE {cents} IS NOT NULL')
+        op.drop_column('companies', cents)
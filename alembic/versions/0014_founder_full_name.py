@@ -0,0 +1,31 @@
+"""Add a generated full_name column to founders
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0014'
+down_revision = '0013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'founders',
+        sa.Column(
+            'full_name',
+            sa.String(length=201),
+            sa.Computed("first_name || ' ' || last_name", persisted=True),
+            comment='First and last name, generated by the database',
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('founders', 'full_name')
@@ -0,0 +1,43 @@
+"""Add trigram indexes for founder name and bio search
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16 22:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0015'
+down_revision = '0014'
+branch_labels = None
+depends_on = None
+
+# (index name, column) pairs, matching Founder.__table_args__
+_TRGM_INDEXES = (
+    ('ix_founders_fn_trgm', 'first_name'),
+    ('ix_founders_ln_trgm', 'last_name'),
+    ('ix_founders_bio_trgm', 'bio'),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and avoids
+    # locking founders against writes while the indexes build
+    with op.get_context().autocommit_block():
+        for name, column in _TRGM_INDEXES:
+            op.create_index(
+                name,
+                'founders',
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(_TRGM_INDEXES):
+            op.drop_index(name, table_name='founders', postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""Index founder skills for containment and fuzzy search
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0016'
+down_revision = '0015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Built concurrently outside a transaction so founders stays writable
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_founders_skills_gin',
+            'founders',
+            ['skills'],
+            postgresql_using='gin',
+            postgresql_ops={'skills': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_founders_skills_trgm',
+            'founders',
+            [sa.text('CAST(skills AS TEXT) gin_trgm_ops')],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_founders_skills_trgm', table_name='founders', postgresql_concurrently=True)
+        op.drop_index('ix_founders_skills_gin', table_name='founders', postgresql_concurrently=True)
@@ -0,0 +1,34 @@
+"""Index company_founders by founder and current flag
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16 23:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0017'
+down_revision = '0016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_company_founders_founder_current',
+            'company_founders',
+            ['founder_id', 'is_current'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_company_founders_founder_current',
+            table_name='company_founders',
+            postgresql_concurrently=True,
+        )
@@ -1,5 +1,6 @@
 """Application configuration management."""
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -47,7 +48,7 @@ class Settings(BaseSettings):
             return v
         values = info.data if hasattr(info, 'data') else {}
         return str(Url.build(
-            scheme="postgresql",
+            scheme="postgresql+psycopg2",
             username=values.get("POSTGRES_USER"),
             password=values.get("POSTGRES_PASSWORD"),
             host=values.get("POSTGRES_SERVER"),
@@ -131,4 +132,14 @@ class Settings(BaseSettings):
     }
 
 
-settings = Settings()
+@lru_cache()
+def get_settings() -> Settings:
+    """Get the cached application settings.
+
+    Returns:
+        The process-wide settings instance.
+    """
+    return Settings()
+
+
+settings = get_settings()
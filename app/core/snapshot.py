@@ -1,5 +1,6 @@
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from datetime import datetime
 
@@ -193,3 +194,13 @@ class SnapshotService(BaseService):
             "redis_status": redis_status,
             "storage_type": "redis" if self.use_redis else "memory"
         }
+
+
+@lru_cache()
+def get_snapshot_service() -> SnapshotService:
+    """Get the process-wide snapshot service instance.
+
+    Returns:
+        The shared snapshot service.
+    """
+    return SnapshotService()
@@ -1,19 +1,35 @@
 """Database session management."""
-from typing import Generator
+from typing import Any, Generator
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson.
+
+    Args:
+        value: The Python value bound to a JSON column.
+
+    Returns:
+        The JSON document as a string.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create SQLAlchemy engine
 engine = create_engine(
-    settings.DATABASE_URI,
+    str(settings.DATABASE_URI),
     pool_pre_ping=True,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
@@ -1,19 +1,21 @@
 """FastAPI application entry point."""
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from starlette.requests import ClientDisconnect
 
 from app.api import api_router
 from app.core.config import settings
 from app.core.scheduler import get_scheduler
-from app.core.snapshot import SnapshotService
-from app.services.updater.airtable import AirtableUpdater
-from app.services.updater.zerodb import ZeroDBUpdater
-
-snapshot_service = SnapshotService()
-airtable_updater = AirtableUpdater()
-zerodb_updater = ZeroDBUpdater()
+from app.core.snapshot import get_snapshot_service
+from app.schemas.founder import warm_up_email_validation
+from app.services.updater.airtable import get_airtable_updater
+from app.services.updater.zerodb import get_zerodb_updater
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +24,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start services on application startup and stop them on shutdown.
+
+    Services are independent of each other, so they are initialized and shut
+    down concurrently.
+    """
+    logger.info("Starting up application...")
+    warm_up_email_validation()
+    scheduler = await get_scheduler()
+    snapshot_service = get_snapshot_service()
+    airtable_updater = get_airtable_updater()
+    zerodb_updater = get_zerodb_updater()
+    await asyncio.gather(
+        scheduler.start(),
+        snapshot_service.initialize(),
+        airtable_updater.initialize(),
+        zerodb_updater.initialize(),
+    )
+    logger.info("Scheduler, snapshot service and updaters initialized")
+
+    yield
+
+    logger.info("Shutting down application...")
+    await asyncio.gather(
+        scheduler.stop(),
+        snapshot_service.shutdown(),
+        airtable_updater.shutdown(),
+        zerodb_updater.shutdown(),
+    )
+    logger.info("Scheduler, snapshot service and updaters shut down")
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -30,6 +66,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Include API router
@@ -57,54 +94,26 @@ async def api_v1_health_check():
     """API v1 health check."""
     return {"status": "ok"}
 
-# Exception handlers
+# Exception handlers. HTTP and request validation errors use FastAPI's
+# default handlers and are not logged: they are client errors, and a
+# warning per 4xx floods the logs under load.
+@app.exception_handler(ClientDisconnect)
+async def client_disconnect_handler(request: Request, exc: ClientDisconnect):
+    """Drop requests whose client went away while the body was being read.
+
+    No one is left to receive the response, so this is not an error.
+    Cancelled handlers raise ``asyncio.CancelledError``, a ``BaseException``
+    that the ``Exception`` handler below never sees.
+    """
+    logger.debug("Client disconnected during %s %s", request.method, request.url.path)
+    return Response(status_code=499)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler."""
+    """Global exception handler for unexpected errors."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal Server Error"},
     )
-
-# Application startup event
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info("Starting up application...")
-    
-    # Initialize scheduler
-    scheduler = await get_scheduler()
-    await scheduler.start()
-    logger.info("Scheduler started")
-
-    # Initialize snapshot service
-    await snapshot_service.initialize()
-    logger.info("Snapshot service initialized")
-
-    # Initialize updaters
-    await airtable_updater.initialize()
-    logger.info("Airtable updater initialized")
-    await zerodb_updater.initialize()
-    logger.info("ZeroDB updater initialized")
-
-# Application shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    logger.info("Shutting down application...")
-    
-    # Shutdown scheduler
-    scheduler = await get_scheduler()
-    await scheduler.stop()
-    logger.info("Scheduler stopped")
-
-    # Shutdown snapshot service
-    await snapshot_service.shutdown()
-    logger.info("Snapshot service shut down")
-
-    # Shutdown updaters
-    await airtable_updater.shutdown()
-    logger.info("Airtable updater shut down")
-    await zerodb_updater.shutdown()
-    logger.info("ZeroDB updater shut down")
@@ -2,4 +2,5 @@
 from app.models.company import Company, CompanyFounder  # noqa: F401
 from app.models.founder import Founder  # noqa: F401
 from app.models.investor import Investor  # noqa: F401
-from app.models.funding_round import FundingRound, InvestmentParticipant  # noqa: F401
+from app.models.funding_round import FundingRound  # noqa: F401
+from app.models.investment_participant import InvestmentParticipant  # noqa: F401
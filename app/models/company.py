@@ -1,16 +1,19 @@
 """Company and related models with enhanced fields for real API integration."""
 from datetime import date, datetime
+from decimal import ROUND_HALF_UP, Decimal
 from typing import List, Optional, Dict, Any
 from enum import Enum as PyEnum
 import json
 
-from sqlalchemy import Column, Date, DateTime, Enum as SQLEnum, ForeignKey, Numeric, String, Text, JSON, Boolean
+from sqlalchemy import BigInteger, Column, Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Numeric, String, Text, JSON, Boolean, Select, select
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, load_only, mapped_column, raiseload, relationship, validates
 from sqlalchemy.sql import func
 from pydantic import BaseModel, Field, HttpUrl
 
 from app.db.session import Base
+from app.models.mixins import ApiSyncMixin
 
 
 class CompanyStatus(str, PyEnum):
@@ -21,6 +24,33 @@ class CompanyStatus(str, PyEnum):
     UNKNOWN = 'UNKNOWN'
 
 
+# Quantum for rounding an amount already scaled to cents
+_WHOLE_CENTS = Decimal('1')
+
+
+def _to_cents(amount: Optional[Any]) -> Optional[int]:
+    """Convert a monetary amount in major currency units to integer cents.
+
+    Goes through ``Decimal(str(amount))`` so floats such as 1.005 round
+    half up to 101 instead of inheriting binary rounding error.
+    """
+    if amount is None:
+        return None
+    return int((Decimal(str(amount)) * 100).quantize(_WHOLE_CENTS, ROUND_HALF_UP))
+
+
+# Columns copied verbatim from API payloads by ``Company.update_from_api``
+_API_SCALAR_FIELDS = (
+    'name', 'legal_name', 'description', 'short_description',
+    'website', 'blog_url', 'twitter_url', 'linkedin_url', 'facebook_url', 'crunchbase_url',
+    'founded_date', 'status',
+    'last_funding_date', 'last_funding_type',
+    'country', 'region', 'city', 'address', 'postal_code',
+    'employee_range',
+    'industries', 'tags', 'metrics', 'external_ids',
+)
+
+
 class CompanyIndustry(BaseModel):
     """Industry classification for companies."""
     name: str
@@ -40,7 +70,7 @@ class CompanyMetrics(BaseModel):
     valuation: Optional[float] = None
 
 
-class Company(Base):
+class Company(ApiSyncMixin, Base):
     """Enhanced Company model with comprehensive fields for real API integration."""
     __tablename__ = 'companies'
 
@@ -52,12 +82,12 @@ class Company(Base):
     short_description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Contact information
-    website: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    blog_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    twitter_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    linkedin_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    facebook_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    crunchbase_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    website: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    blog_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    twitter_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    linkedin_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    facebook_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    crunchbase_url: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
     
     # Company details
     founded_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
@@ -67,22 +97,22 @@ class Company(Base):
         index=True
     )
     
-    # Financial information
-    total_funding: Mapped[Optional[float]] = mapped_column(Numeric(20, 2), nullable=True)
-    last_funding_amount: Mapped[Optional[float]] = mapped_column(Numeric(20, 2), nullable=True)
+    # Financial information (money is stored as integer cents)
+    total_funding_cents: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    last_funding_amount_cents: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     last_funding_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
-    last_funding_type: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    last_funding_type: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     
     # Location
-    country: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
-    region: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    city: Mapped[Optional[str]] = mapped_column(String, nullable=True, index=True)
-    address: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    postal_code: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    country: Mapped[Optional[str]] = mapped_column(String(2), nullable=True, index=True)  # ISO 3166-1 alpha-2
+    region: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    city: Mapped[Optional[str]] = mapped_column(String(128), nullable=True, index=True)
+    address: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    postal_code: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     
     # Employee information
     employee_count: Mapped[Optional[int]] = mapped_column(nullable=True, index=True)
-    employee_range: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    employee_range: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     
     # Additional metadata
     industries: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
@@ -110,15 +140,51 @@ class Company(Base):
     funding_rounds: Mapped[List['FundingRound']] = relationship(
         'FundingRound', back_populates='company', cascade='all, delete-orphan', lazy='selectin'
     )
+    # Participants across all of the company's rounds, joined through funding_rounds
     investors: Mapped[List['InvestmentParticipant']] = relationship(
-        'InvestmentParticipant', back_populates='company', cascade='all, delete-orphan', lazy='selectin'
+        'InvestmentParticipant',
+        secondary='funding_rounds',
+        primaryjoin='Company.id == FundingRound.company_id',
+        secondaryjoin='FundingRound.id == InvestmentParticipant.round_id',
+        viewonly=True,
+        lazy='selectin'
     )
     
     # Indexes
     __table_args__ = (
-        {'postgresql_using': 'gin', 'postgresql_ops': {'tags': 'gin_trgm_ops'}},
+        Index('ix_companies_tags', 'tags', postgresql_using='gin'),
     )
     
+    @hybrid_property
+    def total_funding(self) -> Optional[float]:
+        """Total funding in major currency units."""
+        if self.total_funding_cents is None:
+            return None
+        return self.total_funding_cents / 100
+
+    @total_funding.setter
+    def total_funding(self, value: Optional[Any]) -> None:
+        self.total_funding_cents = _to_cents(value)
+
+    @total_funding.expression
+    def total_funding(cls):
+        return cls.total_funding_cents / 100.0
+
+    @hybrid_property
+    def last_funding_amount(self) -> Optional[float]:
+        """Amount of the most recent funding round in major currency units."""
+        if self.last_funding_amount_cents is None:
+            return None
+        return self.last_funding_amount_cents / 100
+
+    @last_funding_amount.setter
+    def last_funding_amount(self, value: Optional[Any]) -> None:
+        self.last_funding_amount_cents = _to_cents(value)
+
+    @last_funding_amount.expression
+    def last_funding_amount(cls):
+        return cls.last_funding_amount_cents / 100.0
+
     @validates('metrics')
     def validate_metrics(self, key, value):
         if value is not None:
@@ -138,58 +204,26 @@ class Company(Base):
         from .founder import Founder
         from .funding_round import FundingRound, InvestmentParticipant
         
-        # Basic info
-        self.name = data.get('name', self.name)
-        self.legal_name = data.get('legal_name', self.legal_name)
-        self.description = data.get('description', self.description)
-        self.short_description = data.get('short_description', self.short_description)
+        changed = False
+        for field in _API_SCALAR_FIELDS:
+            if field in data:
+                changed |= self._setattr_if_changed(field, data[field])
         
-        # Contact info
-        self.website = data.get('website', self.website)
-        self.blog_url = data.get('blog_url', self.blog_url)
-        self.twitter_url = data.get('twitter_url', self.twitter_url)
-        self.linkedin_url = data.get('linkedin_url', self.linkedin_url)
-        self.facebook_url = data.get('facebook_url', self.facebook_url)
-        self.crunchbase_url = data.get('crunchbase_url', self.crunchbase_url)
-        
-        # Company details
-        if 'founded_date' in data:
-            self.founded_date = data['founded_date']
-        self.status = data.get('status', self.status)
-        
-        # Financial info
+        # Financial info, compared after coercion to cents
         if 'total_funding' in data:
-            self.total_funding = float(data['total_funding']) if data['total_funding'] is not None else None
+            changed |= self._setattr_if_changed('total_funding_cents', _to_cents(data['total_funding']))
         if 'last_funding_amount' in data:
-            self.last_funding_amount = float(data['last_funding_amount']) if data['last_funding_amount'] is not None else None
-        if 'last_funding_date' in data:
-            self.last_funding_date = data['last_funding_date']
-        self.last_funding_type = data.get('last_funding_type', self.last_funding_type)
-        
-        # Location
-        self.country = data.get('country', self.country)
-        self.region = data.get('region', self.region)
-        self.city = data.get('city', self.city)
-        self.address = data.get('address', self.address)
-        self.postal_code = data.get('postal_code', self.postal_code)
+            changed |= self._setattr_if_changed('last_funding_amount_cents', _to_cents(data['last_funding_amount']))
         
         # Employee info
         if 'employee_count' in data:
-            self.employee_count = int(data['employee_count']) if data['employee_count'] is not None else None
-        self.employee_range = data.get('employee_range', self.employee_range)
-        
-        # Additional metadata
-        if 'industries' in data:
-            self.industries = data['industries']
-        if 'tags' in data:
-            self.tags = data['tags']
-        if 'metrics' in data:
-            self.metrics = data['metrics']
-        if 'external_ids' in data:
-            self.external_ids = data['external_ids']
+            employee_count = int(data['employee_count']) if data['employee_count'] is not None else None
+            changed |= self._setattr_if_changed('employee_count', employee_count)
         
-        # Update sync timestamp
-        self.last_synced_at = datetime.utcnow()
+        # Only bump the sync timestamp when something changed, so a no-op
+        # sync leaves the row clean and no UPDATE is emitted
+        if changed:
+            self.last_synced_at = datetime.utcnow()
         
         # Process founders
         if 'founders' in data:
@@ -266,6 +300,36 @@ class Company(Base):
             if 'investors' in round_data:
                 funding_round._process_investors(round_data['investors'])
     
+    @classmethod
+    def summary_query(cls) -> Select:
+        """Build a query that loads only the columns used by ``to_summary_dict``.
+
+        Relationships are set to raise on access so list endpoints never fall
+        back to lazy loading founders or funding rounds row by row.
+        """
+        return select(cls).options(
+            load_only(
+                cls.id,
+                cls.name,
+                cls.status,
+                cls.total_funding_cents,
+                cls.last_funding_date,
+                cls.country,
+            ),
+            raiseload('*'),
+        )
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """Convert company to a flat dictionary for list endpoints."""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'total_funding': self.total_funding,
+            'last_funding_date': self.last_funding_date.isoformat() if self.last_funding_date else None,
+            'country': self.country,
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert company to dictionary."""
         return {
@@ -277,8 +341,8 @@ class Company(Base):
             'website': self.website,
             'founded_date': self.founded_date.isoformat() if self.founded_date else None,
             'status': self.status,
-            'total_funding': float(self.total_funding) if self.total_funding is not None else None,
-            'last_funding_amount': float(self.last_funding_amount) if self.last_funding_amount is not None else None,
+            'total_funding': self.total_funding,
+            'last_funding_amount': self.last_funding_amount,
             'last_funding_date': self.last_funding_date.isoformat() if self.last_funding_date else None,
             'last_funding_type': self.last_funding_type,
             'employee_count': self.employee_count,
@@ -327,6 +391,7 @@ class CompanyFounder(Base):
     """Enhanced association table between Company and Founder with additional attributes."""
     __tablename__ = 'company_founders'
     __table_args__ = (
+        Index('ix_company_founders_founder_current', 'founder_id', 'is_current'),
         {'comment': 'Association table between companies and their founders with role information'},
     )
 
@@ -440,7 +505,7 @@ class CompanyFounder(Base):
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
             'last_verified_at': self.last_verified_at.isoformat() if self.last_verified_at else None,
-            'founder': self.founder.to_dict() if self.founder else None
+            'founder': self.founder.to_dict(iso_dates=True) if self.founder else None
         }
 
     def __repr__(self) -> str:
@@ -1,16 +1,47 @@
 """Enhanced Founder model with comprehensive fields and API integration."""
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import List, Dict, Any, Optional
 from enum import Enum as PyEnum
-import re
+from operator import attrgetter
 
-from sqlalchemy import Column, Date, DateTime, String, Text, Boolean, ForeignKey, JSON
+import orjson
+from sqlalchemy import CheckConstraint, Column, ColumnElement, Computed, Date, DateTime, Index, Select, String, Text, Boolean, ForeignKey, JSON, cast, inspect, literal, select, text, update
 from sqlalchemy.dialects.postgresql import JSONB, ENUM
-from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from sqlalchemy.orm import Mapped, Session, mapped_column, object_session, raiseload, relationship, selectinload, validates
 from sqlalchemy.sql import func
-from pydantic import BaseModel, EmailStr, HttpUrl, validator
+from pydantic import BaseModel, ConfigDict, EmailStr, HttpUrl, TypeAdapter, validator
 
 from app.db.session import Base
+from app.models.mixins import ApiSyncMixin
+
+# Format checks enforced by Postgres CHECK constraints on the founders table
+_EMAIL_PATTERN = r'^[^@]+@[^@]+\.[^@]+$'
+_LINKEDIN_URL_PATTERN = r'^https?://www\.linkedin\.com/'
+
+# Columns copied from API payloads by ``Founder.update_from_api``
+_API_SCALAR_FIELDS = (
+    'first_name', 'last_name',
+    'email', 'phone',
+    'title', 'primary_role', 'bio',
+    'linkedin_url', 'twitter_url', 'github_url', 'personal_website',
+    'education', 'experience', 'skills',
+    'is_verified',
+)
+
+# Keys and getters for ``Founder._raw_dict``, bound once at import time
+_DICT_FIELDS = tuple((key, attrgetter(key)) for key in (
+    'id', 'first_name', 'last_name', 'name',
+    'email', 'phone',
+    'title', 'primary_role', 'bio', 'skills',
+    'linkedin_url', 'twitter_url', 'github_url', 'personal_website',
+    'education', 'experience', 'external_ids',
+    'is_verified', 'is_active',
+    'created_at', 'updated_at', 'last_synced_at',
+))
+
+# CompanyFounder columns copied as-is into ``companies`` entries
+_COMPANY_LINK_KEYS = ('company_id', 'title', 'is_current', 'start_date', 'end_date', 'is_board_member')
+_get_company_link_fields = attrgetter(*_COMPANY_LINK_KEYS)
 
 
 class FounderRole(str, PyEnum):
@@ -23,8 +54,21 @@ class FounderRole(str, PyEnum):
     OTHER = 'other'
 
 
+
+# Background entries are validated in bulk on import: unknown payload keys are
+# dropped rather than collected, and instances are never mutated.
+_BACKGROUND_MODEL_CONFIG = ConfigDict(
+    extra='ignore',
+    frozen=True,
+    from_attributes=True,
+    str_strip_whitespace=True,
+    validate_assignment=False,
+)
+
 class Education(BaseModel):
     """Education history for a founder."""
+    model_config = _BACKGROUND_MODEL_CONFIG
+    
     institution: str
     degree: Optional[str] = None
     field_of_study: Optional[str] = None
@@ -35,6 +79,8 @@ class Education(BaseModel):
 
 class WorkExperience(BaseModel):
     """Work experience for a founder."""
+    model_config = _BACKGROUND_MODEL_CONFIG
+    
     company: str
     title: str
     location: Optional[str] = None
@@ -44,12 +90,14 @@ class WorkExperience(BaseModel):
     description: Optional[str] = None
 
 
-class Founder(Base):
+# Validators for the JSONB background columns, built once per process
+_EDUCATION_LIST_ADAPTER = TypeAdapter(List[Education])
+_EXPERIENCE_LIST_ADAPTER = TypeAdapter(List[WorkExperience])
+
+
+class Founder(ApiSyncMixin, Base):
     """Enhanced Founder model with comprehensive fields for real API integration."""
     __tablename__ = 'founders'
-    __table_args__ = (
-        {'comment': 'Founders and key team members of companies'},
-    )
 
     # Core identifiers
     id: Mapped[str] = mapped_column(
@@ -70,6 +118,11 @@ class Founder(Base):
         index=True,
         comment='Last name of the founder'
     )
+    full_name: Mapped[str] = mapped_column(
+        String(201),
+        Computed("first_name || ' ' || last_name", persisted=True),
+        comment='First and last name, generated by the database'
+    )
     
     # Contact information
     email: Mapped[Optional[str]] = mapped_column(
@@ -91,8 +144,13 @@ class Founder(Base):
         nullable=True,
         comment='Current professional title/role'
     )
-    primary_role: Mapped[Optional[str]] = mapped_column(
-        ENUM(FounderRole, name='founder_role'),
+    primary_role: Mapped[Optional[FounderRole]] = mapped_column(
+        ENUM(
+            FounderRole,
+            name='founder_role',
+            values_callable=lambda roles: [role.value for role in roles],
+            create_type=False,
+        ),
         nullable=True,
         comment='Primary role in companies (founder, co-founder, etc.)'
     )
@@ -186,7 +244,6 @@ class Founder(Base):
         Boolean,
         default=True,
         nullable=False,
-        index=True,
         comment='Whether the founder is currently active'
     )
 
@@ -198,95 +255,154 @@ class Founder(Base):
         lazy='selectin',
         passive_deletes=True
     )
+    # Current associations only, filtered in SQL and loaded on first access
+    current_companies: Mapped[List['CompanyFounder']] = relationship(
+        'CompanyFounder',
+        primaryjoin='and_(CompanyFounder.founder_id == Founder.id, CompanyFounder.is_current.is_(True))',
+        viewonly=True,
+        lazy='select'
+    )
     
-    # Indexes
+    # Constraints and indexes
     __table_args__ = (
-        {'postgresql_using': 'gin', 'postgresql_ops': {'skills': 'gin_trgm_ops'}},
+        CheckConstraint(
+            f"email IS NULL OR email ~ '{_EMAIL_PATTERN}'",
+            name='founders_email_fmt',
+        ),
+        CheckConstraint(
+            f"linkedin_url IS NULL OR linkedin_url ~ '{_LINKEDIN_URL_PATTERN}'",
+            name='founders_li_fmt',
+        ),
+        Index(
+            'ix_founders_skills_gin',
+            'skills',
+            postgresql_using='gin',
+            postgresql_ops={'skills': 'jsonb_path_ops'},
+        ),
+        Index(
+            'ix_founders_skills_trgm',
+            cast(skills.column, Text).label('skills_text'),
+            postgresql_using='gin',
+            postgresql_ops={'skills_text': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_founders_fullname_trgm',
+            'full_name',
+            postgresql_using='gin',
+            postgresql_ops={'full_name': 'gin_trgm_ops'},
+        ),
+        # On the raw columns: trigram GIN indexes serve ILIKE directly, and
+        # an index on lower(...) would not match the plain ILIKE filters
+        Index(
+            'ix_founders_fn_trgm',
+            'first_name',
+            postgresql_using='gin',
+            postgresql_ops={'first_name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_founders_ln_trgm',
+            'last_name',
+            postgresql_using='gin',
+            postgresql_ops={'last_name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_founders_bio_trgm',
+            'bio',
+            postgresql_using='gin',
+            postgresql_ops={'bio': 'gin_trgm_ops'},
+        ),
+        # Partial indexes for the common active-only listings; is_active
+        # itself is too unselective to be worth a plain index
+        Index(
+            'ix_founders_active_name',
+            'last_name',
+            'first_name',
+            postgresql_where=text('is_active'),
+        ),
+        Index(
+            'ix_founders_active_updated',
+            'updated_at',
+            postgresql_where=text('is_active'),
+        ),
+        {'comment': 'Founders and key team members of companies'},
     )
     
     @property
     def name(self) -> str:
-        """Get the full name of the founder."""
+        """Get the full name of the founder.
+
+        Joined from the loaded name parts, so it is current before a flush;
+        the generated ``full_name`` column serves SQL-side search and sorting.
+        """
         return f"{self.first_name} {self.last_name}".strip()
     
-    @property
-    def current_companies(self) -> List['CompanyFounder']:
-        """Get current company associations."""
-        return [cf for cf in self.companies if cf.is_current]
-    
-    @validates('email')
-    def validate_email(self, key, email):
-        """Validate email format."""
-        if email is not None and not re.match(r'^[^@]+@[^@]+\.[^@]+$', email):
-            raise ValueError('Invalid email format')
-        return email
-    
-    @validates('linkedin_url')
-    def validate_linkedin_url(self, key, url):
-        """Validate LinkedIn URL format."""
-        if url and not url.startswith(('https://www.linkedin.com/', 'http://www.linkedin.com/')):
-            raise ValueError('Invalid LinkedIn URL')
-        return url
+    @classmethod
+    def skill_matches(cls, term: str) -> ColumnElement[bool]:
+        """Build a fuzzy filter matching ``term`` against any of the founder's skills.
+
+        Uses the pg_trgm word-similarity operator so the
+        ``ix_founders_skills_trgm`` index serves skill autocomplete.
+        """
+        return literal(term).op('<%')(cast(cls.skills, Text))
     
     @validates('education')
     def validate_education(self, key, education_list):
         """Validate education data."""
         if education_list is not None:
-            return [Education(**ed).dict() for ed in education_list]
+            return _EDUCATION_LIST_ADAPTER.dump_python(
+                _EDUCATION_LIST_ADAPTER.validate_python(education_list), mode='json'
+            )
         return None
     
     @validates('experience')
     def validate_experience(self, key, experience_list):
         """Validate work experience data."""
         if experience_list is not None:
-            return [WorkExperience(**exp).dict() for exp in experience_list]
+            return _EXPERIENCE_LIST_ADAPTER.dump_python(
+                _EXPERIENCE_LIST_ADAPTER.validate_python(experience_list), mode='json'
+            )
         return None
     
     def update_from_api(self, data: Dict[str, Any]) -> None:
         """Update founder data from API response."""
-        # Basic info
-        if 'first_name' in data:
-            self.first_name = data['first_name']
-        if 'last_name' in data:
-            self.last_name = data['last_name']
-        
-        # Contact info
-        self.email = data.get('email', self.email)
-        self.phone = data.get('phone', self.phone)
-        
-        # Professional info
-        self.title = data.get('title', self.title)
-        if 'primary_role' in data:
-            self.primary_role = data['primary_role']
-        self.bio = data.get('bio', self.bio)
+        changed = False
+        for field in _API_SCALAR_FIELDS:
+            if field in data:
+                changed |= self._setattr_if_changed(field, data[field])
         
-        # Social profiles
-        self.linkedin_url = data.get('linkedin_url', self.linkedin_url)
-        self.twitter_url = data.get('twitter_url', self.twitter_url)
-        self.github_url = data.get('github_url', self.github_url)
-        self.personal_website = data.get('personal_website', self.personal_website)
-        
-        # Background
-        if 'education' in data:
-            self.education = data['education']
-        if 'experience' in data:
-            self.experience = data['experience']
-        if 'skills' in data:
-            self.skills = data['skills']
-        
-        # Metadata
+        # Metadata: only keys whose values differ are merged
         if 'external_ids' in data:
-            if self.external_ids:
-                self.external_ids.update(data['external_ids'])
-            else:
-                self.external_ids = data['external_ids']
+            current_ids = self.external_ids or {}
+            delta = {
+                key: value for key, value in data['external_ids'].items()
+                if current_ids.get(key) != value
+            }
+            if delta:
+                changed = True
+                session = object_session(self)
+                if session is not None and inspect(self).persistent:
+                    # Merge in the database with jsonb || in a statement of its
+                    # own, so only the changed keys are sent and no SQL
+                    # expression is left on the instance. The UPDATE also bumps
+                    # updated_at, so both attributes reload on next access
+                    session.execute(
+                        update(Founder)
+                        .where(Founder.id == self.id)
+                        .values(
+                            external_ids=func.coalesce(
+                                Founder.external_ids, cast({}, JSONB)
+                            ).op('||')(cast(delta, JSONB))
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+                    session.expire(self, ['external_ids', 'updated_at'])
+                else:
+                    # Reassign rather than update in place so the change is tracked
+                    self.external_ids = {**current_ids, **delta}
         
-        # Update sync timestamp
-        self.last_synced_at = datetime.utcnow()
-        
-        # Update verification status if provided
-        if 'is_verified' in data:
-            self.is_verified = data['is_verified']
+        # Update sync timestamp; skipped for no-op syncs so the row stays clean
+        if changed:
+            self.last_synced_at = datetime.now(timezone.utc)
     
     def add_education(
         self,
@@ -297,20 +413,24 @@ class Founder(Base):
         end_year: Optional[int] = None,
         description: Optional[str] = None
     ) -> None:
-        """Add an education entry to the founder's profile."""
-        education = Education(
-            institution=institution,
-            degree=degree,
-            field_of_study=field_of_study,
-            start_year=start_year,
-            end_year=end_year,
-            description=description
-        )
+        """Add an education entry to the founder's profile.
+
+        Arguments are already typed, so the entry is built directly in the
+        shape of ``Education`` without running the Pydantic validator.
+        """
+        education = {
+            'institution': institution,
+            'degree': degree,
+            'field_of_study': field_of_study,
+            'start_year': start_year,
+            'end_year': end_year,
+            'description': description,
+        }
         
         if self.education is None:
             self.education = []
         
-        self.education.append(education.dict())
+        self.education.append(education)
     
     def add_experience(
         self,
@@ -322,62 +442,119 @@ class Founder(Base):
         is_current: bool = False,
         description: Optional[str] = None
     ) -> None:
-        """Add a work experience entry to the founder's profile."""
-        experience = WorkExperience(
-            company=company,
-            title=title,
-            location=location,
-            start_date=start_date,
-            end_date=end_date,
-            is_current=is_current,
-            description=description
-        )
+        """Add a work experience entry to the founder's profile.
+
+        Arguments are already typed, so the entry is built directly in the
+        shape of ``WorkExperience`` without running the Pydantic validator.
+        """
+        experience = {
+            'company': company,
+            'title': title,
+            'location': location,
+            'start_date': start_date.isoformat() if start_date else None,
+            'end_date': end_date.isoformat() if end_date else None,
+            'is_current': is_current,
+            'description': description,
+        }
         
         if self.experience is None:
             self.experience = []
         
-        self.experience.append(experience.dict())
+        self.experience.append(experience)
     
-    def to_dict(self, include_companies: bool = False) -> Dict[str, Any]:
-        """Convert founder to dictionary representation."""
-        result = {
-            'id': self.id,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'name': self.name,
-            'email': self.email,
-            'phone': self.phone,
-            'title': self.title,
-            'primary_role': self.primary_role,
-            'bio': self.bio,
-            'skills': self.skills,
-            'linkedin_url': self.linkedin_url,
-            'twitter_url': self.twitter_url,
-            'github_url': self.github_url,
-            'personal_website': self.personal_website,
-            'education': self.education,
-            'experience': self.experience,
-            'external_ids': self.external_ids,
-            'is_verified': self.is_verified,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'last_synced_at': self.last_synced_at.isoformat() if self.last_synced_at else None,
-        }
+    @classmethod
+    def serialization_query(cls, include_companies: bool = False) -> Select:
+        """Build a query that eagerly loads what ``to_dict`` reads.
+
+        With ``include_companies`` the company associations and each
+        association's company are loaded with SELECT IN batches, so
+        serializing a list of founders does not issue a query per row.
+        Every other relationship raises on access.
+        """
+        from .company import Company, CompanyFounder
         
+        query = select(cls)
         if include_companies:
-            result['companies'] = [{
-                'company_id': cf.company_id,
-                'company_name': cf.company.name if cf.company else None,
-                'title': cf.title,
-                'is_current': cf.is_current,
-                'start_date': cf.start_date.isoformat() if cf.start_date else None,
-                'end_date': cf.end_date.isoformat() if cf.end_date else None,
-                'ownership_percentage': float(cf.ownership_percentage) if cf.ownership_percentage is not None else None,
-                'is_board_member': cf.is_board_member
-            } for cf in self.companies]
+            query = query.options(
+                selectinload(cls.companies)
+                .selectinload(CompanyFounder.company)
+                .load_only(Company.id, Company.name)
+                .raiseload('*'),
+            )
+        return query.options(raiseload('*'))
+    
+    @classmethod
+    def list_rows(cls, session: Session, **filters: Any) -> List[Dict[str, Any]]:
+        """Fetch founders as plain dicts without building ORM instances.
+
+        Selects the ``to_dict`` columns from the table with Core, so list
+        endpoints skip identity-map and attribute-state overhead. The rows
+        match ``to_dict()`` without companies: dates stay as
+        ``date``/``datetime`` and can be passed straight to ``orjson.dumps``.
+
+        Args:
+            session: Database session to execute on.
+            **filters: Column equality filters, e.g. ``is_active=True``.
+
+        Raises:
+            ValueError: If a filter does not name a founders column.
+        """
+        table = cls.__table__
+        unknown = set(filters) - set(table.c.keys())
+        if unknown:
+            raise ValueError(f"Unknown founder filter(s): {', '.join(sorted(unknown))}")
+        
+        columns = [
+            table.c.full_name.label('name') if key == 'name' else table.c[key]
+            for key, _ in _DICT_FIELDS
+        ]
+        query = select(*columns).where(
+            *(table.c[key] == value for key, value in filters.items())
+        )
+        result = session.execute(query)
+        keys = tuple(result.keys())
+        return [dict(zip(keys, row)) for row in result]
+    
+    def _raw_dict(self, include_companies: bool = False) -> Dict[str, Any]:
+        """Build the founder representation with dates left as ``date``/``datetime``."""
+        result = {key: get(self) for key, get in _DICT_FIELDS}
+        
+        if include_companies:
+            companies = []
+            for cf in self.companies:
+                link = dict(zip(_COMPANY_LINK_KEYS, _get_company_link_fields(cf)))
+                link['company_name'] = cf.company.name if cf.company else None
+                link['ownership_percentage'] = (
+                    float(cf.ownership_percentage) if cf.ownership_percentage is not None else None
+                )
+                companies.append(link)
+            result['companies'] = companies
         
         return result
+    
+    def to_dict(self, include_companies: bool = False, iso_dates: bool = False) -> Dict[str, Any]:
+        """Convert founder to dictionary representation.
+
+        Dates are returned as ``date``/``datetime`` objects, which orjson
+        encodes directly. Pass ``iso_dates=True`` for callers that need
+        ISO-8601 strings.
+        """
+        result = self._raw_dict(include_companies)
+        if iso_dates:
+            for key in ('created_at', 'updated_at', 'last_synced_at'):
+                result[key] = result[key].isoformat() if result[key] else None
+            for company in result.get('companies', ()):
+                for key in ('start_date', 'end_date'):
+                    company[key] = company[key].isoformat() if company[key] else None
+        return result
+    
+    def to_json_bytes(self, include_companies: bool = False) -> bytes:
+        """Serialize the founder straight to JSON bytes.
+
+        orjson encodes dates and datetimes natively, so this skips the
+        ``isoformat`` pass done by ``to_dict``.
+        """
+        return orjson.dumps(self._raw_dict(include_companies), option=orjson.OPT_NAIVE_UTC)
 
     def __repr__(self) -> str:
         return f"<Founder(id={self.id}, name='{self.name}', email='{self.email}')>"
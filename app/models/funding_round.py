@@ -1,18 +1,25 @@
-"""Funding round and investment participant models with comprehensive fields and validation."""
-from datetime import date, datetime
+"""Funding round model with comprehensive fields and validation."""
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum as PyEnum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from pydantic import BaseModel, Field, validator
+import orjson
+from pydantic import ConfigDict, Field, TypeAdapter, ValidationError
+from typing_extensions import Annotated, TypedDict
 from sqlalchemy import (
-    Boolean, Column, Date, DateTime, Enum as SQLEnum, ForeignKey, Index,
-    JSON, Numeric, String, Text
+    CHAR, Boolean, CheckConstraint, Column, Computed, Date, DateTime, Enum as SQLEnum, ForeignKey, Index, Integer,
+    JSON, Numeric, Select, String, Table, Text, cast, delete, inspect, select, text
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import (
+    Mapped, Session, column_property, mapped_column, object_session, raiseload, relationship,
+    selectinload, undefer, undefer_group, validates
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from sqlalchemy.sql import func
 
-from app.db.base_class import Base
+from app.db.session import Base
+from app.models.investment_participant import InvestmentParticipant
 
 if TYPE_CHECKING:
     from app.models.company import Company
@@ -73,32 +80,15 @@ class InvestmentStage(str, PyEnum):
     OTHER = "other"
 
 
-class InvestmentTerms(BaseModel):
-    """Pydantic model for validating investment terms JSONB field."""
-    valuation: Optional[Decimal] = Field(None, description="Pre-money valuation in the specified currency")
-    valuation_cap: Optional[Decimal] = Field(None, description="Valuation cap for convertible notes/SAFEs")
-    discount_rate: Optional[Decimal] = Field(None, description="Discount rate (0-1) for convertible notes/SAFEs")
-    interest_rate: Optional[Decimal] = Field(None, description="Interest rate for debt financing (0-1)")
-    maturity_date: Optional[date] = Field(None, description="Maturity date for debt instruments")
-    liquidation_preference: Optional[str] = Field(None, description="Liquidation preference terms")
-    participation_rights: Optional[bool] = Field(None, description="Whether investors have participation rights")
-    anti_dilution: Optional[str] = Field(None, description="Type of anti-dilution protection")
-    board_seats: Optional[int] = Field(None, description="Number of board seats granted to investors")
-    pro_rata_rights: Optional[bool] = Field(None, description="Whether investors have pro-rata rights")
-    information_rights: Optional[bool] = Field(None, description="Whether investors have information rights")
-    drag_along: Optional[bool] = Field(None, description="Whether drag-along rights apply")
-    tag_along: Optional[bool] = Field(None, description="Whether tag-along rights apply")
-    first_refusal: Optional[bool] = Field(None, description="Whether right of first refusal applies")
-    pay_to_play: Optional[bool] = Field(None, description="Whether pay-to-play provisions apply")
-    conversion_terms: Optional[Dict[str, Any]] = Field(None, description="Specific conversion terms")
-    other_terms: Optional[Dict[str, Any]] = Field(None, description="Any other terms not covered above")
-
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            date: lambda v: v.isoformat()
-        }
-        schema_extra = {
+class InvestmentTerms(TypedDict, total=False):
+    """Investment terms stored in the FundingRound investment_terms JSON field.
+
+    Validated through a TypeAdapter into a plain dict, so no model instance
+    is built per write; omitted keys stay absent.
+    """
+    __pydantic_config__ = ConfigDict(
+        extra='forbid',
+        json_schema_extra={
             "example": {
                 "valuation": 10000000.00,
                 "valuation_cap": 15000000.00,
@@ -107,16 +97,192 @@ class InvestmentTerms(BaseModel):
                 "board_seats": 1,
                 "pro_rata_rights": True
             }
+        },
+    )
+
+    valuation: Annotated[Optional[Decimal], Field(description="Pre-money valuation in the specified currency")]
+    valuation_cap: Annotated[Optional[Decimal], Field(description="Valuation cap for convertible notes/SAFEs")]
+    discount_rate: Annotated[Optional[Decimal], Field(description="Discount rate (0-1) for convertible notes/SAFEs")]
+    interest_rate: Annotated[Optional[Decimal], Field(description="Interest rate for debt financing (0-1)")]
+    maturity_date: Annotated[Optional[date], Field(description="Maturity date for debt instruments")]
+    liquidation_preference: Annotated[Optional[str], Field(description="Liquidation preference terms")]
+    participation_rights: Annotated[Optional[bool], Field(description="Whether investors have participation rights")]
+    anti_dilution: Annotated[Optional[str], Field(description="Type of anti-dilution protection")]
+    board_seats: Annotated[Optional[int], Field(description="Number of board seats granted to investors")]
+    pro_rata_rights: Annotated[Optional[bool], Field(description="Whether investors have pro-rata rights")]
+    information_rights: Annotated[Optional[bool], Field(description="Whether investors have information rights")]
+    drag_along: Annotated[Optional[bool], Field(description="Whether drag-along rights apply")]
+    tag_along: Annotated[Optional[bool], Field(description="Whether tag-along rights apply")]
+    first_refusal: Annotated[Optional[bool], Field(description="Whether right of first refusal applies")]
+    pay_to_play: Annotated[Optional[bool], Field(description="Whether pay-to-play provisions apply")]
+    conversion_terms: Annotated[Optional[Dict[str, Any]], Field(description="Specific conversion terms")]
+    other_terms: Annotated[Optional[Dict[str, Any]], Field(description="Any other terms not covered above")]
+
+
+# Validator for the investment_terms JSON column, built once per process
+_INVESTMENT_TERMS_ADAPTER = TypeAdapter(InvestmentTerms)
+
+# Columns copied as-is from API payloads by the ``FundingRound`` API helpers
+_SIMPLE_FIELDS = frozenset({
+    'name', 'round_type', 'investment_stage', 'is_equity', 'is_debt',
+    'is_convertible', 'is_crowdfunding', 'is_confidential', 'is_cancelled',
+    'target_amount', 'raised_amount', 'minimum_investment',
+    'pre_money_valuation', 'post_money_valuation', 'price_per_share',
+    'shares_issued', 'description', 'source_url', 'source_description',
+    'external_id',
+})
+
+# Date columns, accepted as ``date`` objects or ISO-8601 strings
+_DATE_FIELDS = frozenset({
+    'announced_date', 'closed_date', 'expected_close_date',
+    'first_investment_date', 'last_funding_date',
+})
+
+# Fields emitted by ``FundingRound.to_dict``, grouped by conversion
+_DICT_SCALAR_FIELDS = (
+    'id', 'company_id', 'name',
+    'is_equity', 'is_debt', 'is_convertible', 'is_crowdfunding', 'is_confidential', 'is_cancelled',
+    'currency', 'shares_issued', 'duration_days',
+    'description', 'investment_terms', 'source_url', 'source_description', 'external_id',
+)
+_DICT_DECIMAL_COLUMNS = (
+    'target_amount', 'raised_amount', 'minimum_investment',
+    'pre_money_valuation', 'post_money_valuation', 'price_per_share',
+)
+_DICT_DATE_FIELDS = tuple(sorted(_DATE_FIELDS)) + ('created_at', 'updated_at')
+# Enum member -> value lookups, avoiding the Enum.value descriptor per row
+_ROUND_TYPE_VALUE = {member: member.value for member in RoundType}
+_STAGE_VALUE = {member: member.value for member in InvestmentStage}
+_DICT_ENUM_FIELDS = (('round_type', _ROUND_TYPE_VALUE), ('investment_stage', _STAGE_VALUE))
+_DICT_FIELDS = (
+    _DICT_SCALAR_FIELDS + _DICT_DECIMAL_COLUMNS + _DICT_DATE_FIELDS
+    + tuple(field for field, _ in _DICT_ENUM_FIELDS)
+)
+# Computed fields appended after the columns, as (key, attribute) pairs
+_DICT_EXTRA_FIELDS = (
+    ('metadata', 'extra_metadata'),
+    ('total_raised', 'total_raised'),
+    ('participant_count', 'participant_count'),
+    ('is_closed', 'is_closed'),
+)
+
+
+def _float_or_none(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def _isoformat_or_none(value: Any) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+# (key, attribute, converter) for each field of ``FundingRound.to_dict``,
+# resolved once so the per-call work is a single dict comprehension
+_DICT_PLAN: Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...] = (
+    tuple((field, field, None) for field in _DICT_SCALAR_FIELDS)
+    + tuple((field, field, _float_or_none) for field in _DICT_DECIMAL_COLUMNS)
+    + tuple((field, field, _isoformat_or_none) for field in _DICT_DATE_FIELDS)
+    + tuple((field, field, values.get) for field, values in _DICT_ENUM_FIELDS)
+    + tuple(
+        (key, attr, _float_or_none if key == 'total_raised' else None)
+        for key, attr in _DICT_EXTRA_FIELDS
+    )
+)
+
+
+def _encode_round(value: Any) -> Any:
+    """orjson ``default`` hook for the types it does not encode natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _validate_investment_terms(terms: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Validate investment terms and return them in their stored JSON form."""
+    if terms is None:
+        return None
+    try:
+        validated = _INVESTMENT_TERMS_ADAPTER.validate_python(terms)
+    except ValidationError as e:
+        raise ValueError(f"Invalid investment terms: {e}") from e
+    # Decimals and dates become strings in JSON mode
+    return _INVESTMENT_TERMS_ADAPTER.dump_python(validated, mode='json')
+
+
+def _round_row_from_api(round_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a ``funding_rounds`` insert row from an API payload.
+
+    ISO date strings are left as-is for ``FundingRound.from_api_batch`` to
+    parse a whole column at a time.
+    """
+    row: Dict[str, Any] = {'id': round_id}
+    for field, value in data.items():
+        if field in _SIMPLE_FIELDS:
+            row[field] = value
+        elif field in _DATE_FIELDS:
+            if value is not None:
+                row[field] = value
+        elif field == 'investment_terms':
+            row[field] = _validate_investment_terms(value)
+        elif field == 'metadata':
+            row[field] = value
+        elif field == 'currency':
+            row[field] = value.upper() if isinstance(value, str) else value
+    return row
+
+
+def _upsert_rows(
+    session: Session,
+    table: Table,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Tuple[str, ...],
+    merge_columns: Tuple[str, ...] = (),
+) -> None:
+    """Insert ``rows`` into ``table``, updating the rows that already exist.
+
+    Payloads may omit fields, so rows are grouped by key set and each group
+    is sent as one executemany ``INSERT ... ON CONFLICT``; fields absent
+    from a row are left untouched rather than overwritten with NULL.
+    JSONB ``merge_columns`` are merged into the stored value with ``||``
+    instead of replacing it.
+    """
+    rows_by_keys: Dict[frozenset, List[Dict[str, Any]]] = {}
+    for row in rows:
+        rows_by_keys.setdefault(frozenset(row), []).append(row)
+    
+    empty = cast({}, JSONB)
+    for keys, group in rows_by_keys.items():
+        stmt = pg_insert(table)
+        update_columns = {
+            key: (
+                func.coalesce(table.c[key], empty).op('||')(func.coalesce(stmt.excluded[key], empty))
+                if key in merge_columns else stmt.excluded[key]
+            )
+            for key in keys if key not in conflict_columns
         }
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_={**update_columns, 'updated_at': func.now()},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+        session.execute(stmt, group)
 
 
 class FundingRound(Base):
     """Model representing a funding round for a company."""
     __tablename__ = 'funding_rounds'
     __table_args__ = (
-        Index('idx_funding_rounds_company_id', 'company_id'),
+        # Serves "latest rounds for a company" with index-only scans
+        Index(
+            'idx_funding_rounds_company_date',
+            'company_id',
+            text('announced_date DESC NULLS LAST'),
+            postgresql_include=['round_type', 'raised_amount', 'currency'],
+        ),
         Index('idx_funding_rounds_announced_date', 'announced_date'),
         Index('idx_funding_rounds_round_type', 'round_type'),
+        CheckConstraint("currency ~ '^[A-Z]{3}$'", name='funding_rounds_currency_fmt'),
     )
     
     # Primary key and company relationship
@@ -125,7 +291,6 @@ class FundingRound(Base):
         String, 
         ForeignKey('companies.id', ondelete='CASCADE'), 
         nullable=False,
-        index=True,
         comment="Reference to the company that raised this funding round"
     )
     
@@ -203,7 +368,7 @@ class FundingRound(Base):
         comment="Minimum investment amount for this round"
     )
     currency: Mapped[str] = mapped_column(
-        String(3),
+        CHAR(3),
         default="USD",
         nullable=False,
         comment="ISO 4217 currency code (e.g., USD, EUR)"
@@ -255,13 +420,31 @@ class FundingRound(Base):
         nullable=True,
         comment="Date of the most recent investment in this round"
     )
+    duration_days: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        Computed('closed_date - announced_date', persisted=True),
+        nullable=True,
+        comment="Days from announcement to close, generated by the database"
+    )
     
     # Relationships
+    company: Mapped["Company"] = relationship(
+        "Company",
+        back_populates="funding_rounds"
+    )
     participants: Mapped[List["InvestmentParticipant"]] = relationship(
         "InvestmentParticipant",
         back_populates="funding_round",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="raise_on_sql"
+    )
+    # Lead participants only, filtered in SQL. The bare ``is_lead`` predicate
+    # matches the partial index ``ix_ip_round_lead``; ``IS true`` would not.
+    lead_investors: Mapped[List["InvestmentParticipant"]] = relationship(
+        "InvestmentParticipant",
+        primaryjoin="and_(InvestmentParticipant.round_id == FundingRound.id, InvestmentParticipant.is_lead)",
+        viewonly=True,
+        lazy="select"
     )
     
     # Metadata and external references
@@ -291,7 +474,9 @@ class FundingRound(Base):
         unique=True,
         comment="External ID from data providers (e.g., Crunchbase, PitchBook)"
     )
-    metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+    # Named extra_metadata because ``metadata`` is reserved by the declarative base
+    extra_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        'metadata',
         JSON,
         nullable=True,
         comment="Additional unstructured metadata"
@@ -310,57 +495,114 @@ class FundingRound(Base):
         nullable=False
     )
     
-    # Properties
-    @property
-    def total_raised(self) -> Optional[Decimal]:
-        """Calculate total amount raised from all participants if not explicitly set."""
-        if self.raised_amount is not None:
-            return self.raised_amount
-        if self.participants:
-            return sum(p.amount for p in self.participants if p.amount is not None)
-        return None
-
-    @property
-    def lead_investors(self) -> List["InvestmentParticipant"]:
-        """Get list of lead investors in this round."""
-        return [p for p in self.participants if p.is_lead_investor]
-
-    @property
-    def participant_count(self) -> int:
-        """Get total number of participants in this round."""
-        return len(self.participants)
+    # Aggregates over the participants, computed in SQL. Deferred so plain
+    # loads skip the subqueries; ``serialization_query`` undefers them with
+    # the rest of the row, and any other access loads the group in one SELECT.
+    total_raised: Mapped[Optional[Decimal]] = column_property(
+        func.coalesce(
+            raised_amount,
+            select(func.sum(InvestmentParticipant.amount))
+            .where(InvestmentParticipant.round_id == id)
+            .correlate_except(InvestmentParticipant)
+            .scalar_subquery(),
+        ),
+        deferred=True,
+        group='participant_totals',
+    )
+    participant_count: Mapped[int] = column_property(
+        select(func.count())
+        .where(InvestmentParticipant.round_id == id)
+        .correlate_except(InvestmentParticipant)
+        .scalar_subquery(),
+        deferred=True,
+        group='participant_totals',
+    )
 
+    # Properties
     @property
     def is_closed(self) -> bool:
         """Check if the funding round is closed."""
         return self.closed_date is not None
 
-    @property
-    def duration_days(self) -> Optional[int]:
-        """Calculate duration of the funding round in days."""
-        if self.announced_date and self.closed_date:
-            return (self.closed_date - self.announced_date).days
-        return None
+    @classmethod
+    def serialization_query(cls) -> Select:
+        """Build a query that eagerly loads what ``to_dict`` reads.
 
-    # Validation methods
-    @validates('currency')
-    def validate_currency(self, key: str, currency: str) -> str:
-        """Validate currency code is 3 uppercase letters."""
-        if not isinstance(currency, str) or len(currency) != 3 or not currency.isalpha():
-            raise ValueError("Currency must be a 3-letter ISO 4217 code")
-        return currency.upper()
+        The participant aggregates come back as columns of the round row and
+        participants and their investors are loaded with SELECT IN batches,
+        so serializing a list of rounds does not issue a query per row.
+        Any other relationship that would need SQL raises on access.
+        """
+        return select(cls).options(
+            undefer_group('participant_totals'),
+            selectinload(cls.participants).options(
+                undefer(InvestmentParticipant.external_ids),
+                selectinload(InvestmentParticipant.investor),
+            ),
+            raiseload('*', sql_only=True),
+        )
 
+    # Validation methods
     @validates('investment_terms')
     def validate_investment_terms(self, key: str, terms: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Validate investment terms against Pydantic model."""
-        if terms is None:
-            return None
-        try:
-            return InvestmentTerms(**terms).dict(exclude_unset=True)
-        except Exception as e:
-            raise ValueError(f"Invalid investment terms: {e}")
+        return _validate_investment_terms(terms)
 
     # API integration methods
+    @classmethod
+    def from_api_batch(cls, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build ``funding_rounds`` insert rows from a batch of API payloads.
+
+        Dates are parsed a column at a time: each distinct ISO string in a
+        date column is parsed once, and rows sharing a date reuse the
+        result. Payloads without an ``id`` are skipped.
+        """
+        rows = [_round_row_from_api(payload['id'], payload) for payload in payloads if payload.get('id')]
+        for field in _DATE_FIELDS:
+            raw_dates = {row[field] for row in rows if isinstance(row.get(field), str)}
+            if not raw_dates:
+                continue
+            parsed = dict(zip(raw_dates, map(date.fromisoformat, raw_dates)))
+            for row in rows:
+                value = row.get(field)
+                if isinstance(value, str):
+                    row[field] = parsed[value]
+        return rows
+
+    @classmethod
+    def insert_many_from_api(cls, session: Session, payloads: List[Dict[str, Any]]) -> None:
+        """Upsert funding rounds and their participants from API payloads in bulk.
+
+        Builds flat round and participant rows from the payloads and writes
+        each list with ``INSERT ... ON CONFLICT DO UPDATE``, bypassing the
+        unit of work. Participants are only added or updated; use
+        ``update_from_api`` to also drop participants missing from a
+        payload. Payloads without an ``id`` are skipped. Participant rows
+        are built by ``InvestmentParticipant.row_from_api``, as in
+        ``_update_participants``, so the whole batch is checked before
+        anything is written.
+
+        Raises:
+            ValueError: If a participant field fails validation.
+        """
+        round_rows = cls.from_api_batch(payloads)
+        now = datetime.now(timezone.utc)
+        participant_rows = [
+            InvestmentParticipant.row_from_api(payload['id'], participant_data, now)
+            for payload in payloads if payload.get('id')
+            for participant_data in payload.get('participants') or ()
+            if participant_data.get('investor_id')
+        ]
+        
+        _upsert_rows(session, cls.__table__, round_rows, ('id',))
+        _upsert_rows(
+            session,
+            InvestmentParticipant.__table__,
+            participant_rows,
+            ('round_id', 'investor_id'),
+            merge_columns=('external_ids',),
+        )
+
     def update_from_api(self, data: Dict[str, Any], update_relationships: bool = True) -> None:
         """
         Update funding round from API data.
@@ -369,149 +611,123 @@ class FundingRound(Base):
             data: Dictionary containing funding round data
             update_relationships: Whether to update related objects (e.g., participants)
         """
-        # Update simple fields
-        for field in [
-            'name', 'round_type', 'investment_stage', 'is_equity', 'is_debt',
-            'is_convertible', 'is_crowdfunding', 'is_confidential', 'is_cancelled', 
-            'target_amount', 'raised_amount', 'minimum_investment', 'currency', 
-            'pre_money_valuation', 'post_money_valuation', 'price_per_share', 
-            'shares_issued', 'description', 'source_url', 'source_description', 
-            'external_id', 'metadata'
-        ]:
-            if field in data:
-                setattr(self, field, data[field])
-
-        # Update date fields
-        for date_field in [
-            'announced_date', 'closed_date', 'expected_close_date',
-            'first_investment_date', 'last_funding_date'
-        ]:
-            if date_field in data and data[date_field] is not None:
-                if isinstance(data[date_field], str):
-                    setattr(self, date_field, date.fromisoformat(data[date_field]))
-                else:
-                    setattr(self, date_field, data[date_field])
-
-        # Update investment terms
-        if 'investment_terms' in data:
-            self.investment_terms = data['investment_terms']
+        from_isoformat = date.fromisoformat
+        for field, value in data.items():
+            if field in _SIMPLE_FIELDS:
+                setattr(self, field, value)
+            elif field in _DATE_FIELDS:
+                if value is not None:
+                    setattr(self, field, from_isoformat(value) if isinstance(value, str) else value)
+            elif field == 'investment_terms':
+                self.investment_terms = value
+            elif field == 'metadata':
+                self.extra_metadata = value
+            elif field == 'currency':
+                # Format is enforced by the funding_rounds_currency_fmt constraint
+                self.currency = value.upper() if isinstance(value, str) else value
 
         # Update participants if requested
         if update_relationships and 'participants' in data:
             self._update_participants(data['participants'])
 
     def _update_participants(self, participants_data: List[Dict[str, Any]]) -> None:
-        """Update participants from API data."""
-        # Create lookup of existing participants by investor_id
-        existing_participants = {p.investor_id: p for p in self.participants}
-        updated_ids = set()
+        """Sync participants from API data.
+
+        For a round already in the database, all participants are upserted
+        with one ``INSERT ... ON CONFLICT`` per payload shape and the ones
+        missing from ``participants_data`` are removed with a single DELETE,
+        instead of one statement per participant. The rows come from
+        ``InvestmentParticipant.row_from_api``, so values are coerced and
+        validated as on the ORM path, and ``external_ids`` is merged into
+        the stored ids. Every synced participant is stamped with the same
+        ``last_verified_at``.
+
+        Raises:
+            ValueError: If a participant field fails validation.
+        """
+        columns = InvestmentParticipant.__table__.c
+        now = datetime.now(timezone.utc)
+        participants_data = [data for data in participants_data if data.get('investor_id')]
         
-        for participant_data in participants_data:
-            investor_id = participant_data.get('investor_id')
-            if not investor_id:
-                continue
-                
-            if investor_id in existing_participants:
-                # Update existing participant
-                participant = existing_participants[investor_id]
-                participant.update_from_api(participant_data)
-            else:
-                # Create new participant
+        session = object_session(self)
+        if session is None or not inspect(self).persistent:
+            # Nothing stored yet: the participants are inserted with the round
+            participants = []
+            for participant_data in participants_data:
                 participant = InvestmentParticipant(
-                    funding_round_id=self.id,
-                    **{k: v for k, v in participant_data.items() if k != 'id'}
+                    round_id=self.id, investor_id=participant_data['investor_id']
                 )
-                self.participants.append(participant)
-            
-            updated_ids.add(investor_id)
+                participant.update_from_api(participant_data, now)
+                participants.append(participant)
+            self.participants = participants
+            return
+        
+        rows = [
+            InvestmentParticipant.row_from_api(self.id, participant_data, now)
+            for participant_data in participants_data
+        ]
+        _upsert_rows(
+            session,
+            InvestmentParticipant.__table__,
+            rows,
+            ('round_id', 'investor_id'),
+            merge_columns=('external_ids',),
+        )
         
         # Remove participants not in the updated data
-        for participant in list(self.participants):
-            if participant.investor_id not in updated_ids:
-                self.participants.remove(participant)
+        session.execute(
+            delete(InvestmentParticipant.__table__).where(
+                columns.round_id == self.id,
+                columns.investor_id.notin_([row['investor_id'] for row in rows]),
+            )
+        )
+        session.expire(self, ['participants', 'total_raised', 'participant_count'])
+
+    def _loaded_participants(self) -> Optional[List["InvestmentParticipant"]]:
+        """Return the participants if already loaded, without touching SQL.
+
+        ``participants`` is ``raise_on_sql``, so rounds not fetched through
+        ``serialization_query`` (or whose collection was expired) are
+        serialized without them rather than raising.
+        """
+        return inspect(self).dict.get('participants')
+
+    def _raw_dict(self, include_relationships: bool = True) -> Dict[str, Any]:
+        """Build the round representation with Decimals, dates and enums left as-is."""
+        result = {field: getattr(self, field) for field in _DICT_FIELDS}
+        result.update((key, getattr(self, attr)) for key, attr in _DICT_EXTRA_FIELDS)
+        
+        participants = self._loaded_participants() if include_relationships else None
+        if participants:
+            result['participants'] = [p.to_dict() for p in participants]
+            
+        return result
 
     def to_dict(self, include_relationships: bool = True) -> Dict[str, Any]:
         """Convert funding round to dictionary representation."""
         result = {
-            'id': self.id,
-            'company_id': self.company_id,
-            'name': self.name,
-            'round_type': self.round_type.value if self.round_type else None,
-            'investment_stage': self.investment_stage.value if self.investment_stage else None,
-            'is_equity': self.is_equity,
-            'is_debt': self.is_debt,
-            'is_convertible': self.is_convertible,
-            'is_crowdfunding': self.is_crowdfunding,
-            'is_confidential': self.is_confidential,
-            'is_cancelled': self.is_cancelled,
-            'target_amount': float(self.target_amount) if self.target_amount is not None else None,
-            'raised_amount': float(self.raised_amount) if self.raised_amount is not None else None,
-            'minimum_investment': float(self.minimum_investment) if self.minimum_investment is not None else None,
-            'currency': self.currency,
-            'pre_money_valuation': float(self.pre_money_valuation) if self.pre_money_valuation is not None else None,
-            'post_money_valuation': float(self.post_money_valuation) if self.post_money_valuation is not None else None,
-            'price_per_share': float(self.price_per_share) if self.price_per_share is not None else None,
-            'shares_issued': self.shares_issued,
-            'announced_date': self.announced_date.isoformat() if self.announced_date else None,
-            'closed_date': self.closed_date.isoformat() if self.closed_date else None,
-            'expected_close_date': self.expected_close_date.isoformat() if self.expected_close_date else None,
-            'first_investment_date': self.first_investment_date.isoformat() if self.first_investment_date else None,
-            'last_funding_date': self.last_funding_date.isoformat() if self.last_funding_date else None,
-            'description': self.description,
-            'investment_terms': self.investment_terms,
-            'source_url': self.source_url,
-            'source_description': self.source_description,
-            'external_id': self.external_id,
-            'metadata': self.metadata,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'total_raised': float(self.total_raised) if self.total_raised is not None else None,
-            'participant_count': self.participant_count,
-            'is_closed': self.is_closed,
-            'duration_days': self.duration_days
+            key: getattr(self, attr) if convert is None else convert(getattr(self, attr))
+            for key, attr, convert in _DICT_PLAN
         }
-        
-        if include_relationships and self.participants:
-            result['participants'] = [p.to_dict() for p in self.participants]
-            
+        participants = self._loaded_participants() if include_relationships else None
+        if participants:
+            result['participants'] = [p.to_dict(json_compatible=True) for p in participants]
         return result
 
-    def __repr__(self) -> str:
-        return (
-            f"<FundingRound(id={self.id}, company_id={self.company_id}, "
-            f"round_type={self.round_type}, raised_amount={self.raised_amount} {self.currency})>"
-        )
-
+    def to_json_bytes(self, include_relationships: bool = True) -> bytes:
+        """Serialize the round straight to JSON bytes.
 
-class InvestmentParticipant(Base):
-    """Association table between FundingRound and Investor with participation details."""
-    __tablename__ = 'investment_participants'
-
-    round_id: Mapped[str] = mapped_column(
-        String, ForeignKey('funding_rounds.id', ondelete='CASCADE'), primary_key=True
-    )
-    investor_id: Mapped[str] = mapped_column(
-        String, ForeignKey('investors.id', ondelete='CASCADE'), primary_key=True
-    )
-    amount: Mapped[Optional[Decimal]] = mapped_column(Numeric(15, 2), nullable=True)
-    is_lead: Mapped[Optional[bool]] = mapped_column(nullable=True)
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
-    )
-
-    # Relationships
-    funding_round: Mapped['FundingRound'] = relationship(
-        'FundingRound', back_populates='participants'
-    )
-    investor: Mapped['Investor'] = relationship(
-        'Investor', back_populates='investments'
-    )
+        orjson encodes dates, datetimes and enums natively and Decimals
+        through ``_encode_round``, so the values are walked only once.
+        """
+        return orjson.dumps(
+            self._raw_dict(include_relationships),
+            default=_encode_round,
+            option=orjson.OPT_NAIVE_UTC,
+        )
 
     def __repr__(self) -> str:
         return (
-            f"<InvestmentParticipant(round_id={self.round_id}, "
-            f"investor_id={self.investor_id})>"
+            f"<FundingRound(id={self.id}, company_id={self.company_id}, "
+            f"round_type={self.round_type}, raised_amount={self.raised_amount} {self.currency})>"
         )
@@ -1,14 +1,15 @@
 """Investment Participant model for tracking investors in funding rounds."""
-from datetime import date, datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum as PyEnum
-from typing import Optional, Dict, Any, List
+from operator import attrgetter
+from typing import Callable, Iterable, Optional, Dict, Any, List
 
-from sqlalchemy import Column, DateTime, ForeignKey, Numeric, String, Boolean, Text, JSON
+import orjson
+from sqlalchemy import ColumnElement, DateTime, Float, ForeignKey, Index, Numeric, Select, String, Boolean, Text, cast, event, inspect, select, text
 from sqlalchemy.dialects.postgresql import JSONB, ENUM
-from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, selectinload, undefer, validates
 from sqlalchemy.sql import func
-from pydantic import BaseModel, validator, Field
 
 from app.db.session import Base
 
@@ -45,6 +46,119 @@ class InvestmentType(str, PyEnum):
     OTHER = 'other'
 
 
+# Valid ``investment_type`` values, checked before the enum is constructed
+_INVESTMENT_TYPE_VALUES = frozenset(t.value for t in InvestmentType)
+
+
+# Instance ``__dict__`` key holding the memoized ``investment_value``
+_INVESTMENT_VALUE_CACHE = '_iv_cache'
+
+# Fields converted by ``InvestmentParticipant.to_dict(json_compatible=True)``
+_DECIMAL_FIELDS = ('amount', 'share_price', 'ownership_percentage', 'investment_value')
+_DATETIME_FIELDS = ('created_at', 'updated_at', 'last_verified_at')
+
+# Postgres ``to_char`` pattern used by ``bulk_to_records`` for UTC timestamps
+_ISO_UTC_FORMAT = 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"'
+
+
+def _encode_participant(value: Any) -> Any:
+    """orjson ``default`` hook for the types it does not encode natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _optional(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Wrap ``convert`` so that ``None`` passes through unconverted."""
+    def coerce(value: Any) -> Any:
+        return convert(value) if value is not None else None
+    return coerce
+
+
+def _to_decimal(value: Any) -> Decimal:
+    return Decimal(str(value))
+
+
+def _to_investment_type(value: Any) -> InvestmentType:
+    if value not in _INVESTMENT_TYPE_VALUES:
+        raise ValueError(f'Unknown investment type: {value!r}')
+    return InvestmentType(value)
+
+
+# ISO 4217 currency codes accepted by ``InvestmentParticipant.validate_currency``
+_ISO_4217 = frozenset((
+    'AED', 'AFN', 'ALL', 'AMD', 'ANG', 'AOA', 'ARS', 'AUD', 'AWG', 'AZN',
+    'BAM', 'BBD', 'BDT', 'BGN', 'BHD', 'BIF', 'BMD', 'BND', 'BOB', 'BRL',
+    'BSD', 'BTN', 'BWP', 'BYN', 'BZD', 'CAD', 'CDF', 'CHF', 'CLP', 'CNY',
+    'COP', 'CRC', 'CUC', 'CUP', 'CVE', 'CZK', 'DJF', 'DKK', 'DOP', 'DZD',
+    'EGP', 'ERN', 'ETB', 'EUR', 'FJD', 'FKP', 'GBP', 'GEL', 'GHS', 'GIP',
+    'GMD', 'GNF', 'GTQ', 'GYD', 'HKD', 'HNL', 'HTG', 'HUF', 'IDR', 'ILS',
+    'INR', 'IQD', 'IRR', 'ISK', 'JMD', 'JOD', 'JPY', 'KES', 'KGS', 'KHR',
+    'KMF', 'KPW', 'KRW', 'KWD', 'KYD', 'KZT', 'LAK', 'LBP', 'LKR', 'LRD',
+    'LSL', 'LYD', 'MAD', 'MDL', 'MGA', 'MKD', 'MMK', 'MNT', 'MOP', 'MRU',
+    'MUR', 'MVR', 'MWK', 'MXN', 'MYR', 'MZN', 'NAD', 'NGN', 'NIO', 'NOK',
+    'NPR', 'NZD', 'OMR', 'PAB', 'PEN', 'PGK', 'PHP', 'PKR', 'PLN', 'PYG',
+    'QAR', 'RON', 'RSD', 'RUB', 'RWF', 'SAR', 'SBD', 'SCR', 'SDG', 'SEK',
+    'SGD', 'SHP', 'SLE', 'SLL', 'SOS', 'SRD', 'SSP', 'STN', 'SVC', 'SYP',
+    'SZL', 'THB', 'TJS', 'TMT', 'TND', 'TOP', 'TRY', 'TTD', 'TWD', 'TZS',
+    'UAH', 'UGX', 'USD', 'UYU', 'UZS', 'VED', 'VES', 'VND', 'VUV', 'WST',
+    'XAF', 'XCD', 'XCG', 'XOF', 'XPF', 'YER', 'ZAR', 'ZMW', 'ZWG', 'ZWL',
+    # Withdrawn codes that still appear on historical rounds
+    'BYR', 'EEK', 'HRK', 'LTL', 'LVL', 'MRO', 'SKK', 'STD', 'VEF', 'ZMK',
+))
+
+
+def _normalize_currency(currency: Optional[str]) -> str:
+    """Default a missing currency to USD, uppercase it and check it against ISO 4217."""
+    if not currency:
+        return 'USD'
+    if len(currency) != 3:
+        raise ValueError('Currency code must be 3 characters')
+    if not currency.isupper():
+        currency = currency.upper()
+    if currency not in _ISO_4217:
+        raise ValueError(f'Unknown ISO 4217 currency code: {currency}')
+    return currency
+
+
+def _check_ownership_percentage(value: Any) -> Any:
+    """Check that an ownership percentage is between 0 and 100."""
+    if value is not None and (value < 0 or value > 100):
+        raise ValueError('Ownership percentage must be between 0 and 100')
+    return value
+
+
+# Payload fields applied by ``InvestmentParticipant.update_from_api``, mapped
+# to their coercer (None assigns the value as-is)
+_API_FIELD_COERCERS: Dict[str, Optional[Callable[[Any], Any]]] = {
+    'investment_type': _optional(_to_investment_type),
+    'amount': _optional(_to_decimal),
+    'currency': None,
+    'shares_issued': _optional(int),
+    'share_price': _optional(_to_decimal),
+    'ownership_percentage': _optional(float),
+    'is_lead': None,
+    'is_board_seat': None,
+    'is_board_observer': None,
+    'is_pro_rata': None,
+    'notes': None,
+}
+
+# Keys emitted by ``InvestmentParticipant.to_dict``, read in one C-level pass
+_DICT_KEYS = (
+    'round_id', 'investor_id', 'investment_type', 'amount', 'currency',
+    'shares_issued', 'share_price', 'ownership_percentage', 'investment_value',
+    'is_lead', 'is_board_seat', 'is_board_observer', 'is_pro_rata', 'notes',
+    'external_ids', 'created_at', 'updated_at', 'last_verified_at',
+)
+_get_dict_fields = attrgetter(*_DICT_KEYS)
+
+# Related investor and funding round summaries nested by ``to_dict``
+_INVESTOR_KEYS = ('id', 'name', 'type', 'website')
+_get_investor_fields = attrgetter(*_INVESTOR_KEYS)
+_FUNDING_ROUND_KEYS = ('id', 'name', 'round_type', 'announced_date', 'company_id')
+_get_funding_round_fields = attrgetter(*_FUNDING_ROUND_KEYS)
+
 class InvestmentParticipant(Base):
     """
     Enhanced InvestmentParticipant model for tracking investor participation in funding rounds.
@@ -53,9 +167,6 @@ class InvestmentParticipant(Base):
     with additional attributes specific to each investment.
     """
     __tablename__ = 'investment_participants'
-    __table_args__ = (
-        {'comment': 'Investor participation in funding rounds'},
-    )
     
     # Composite primary key
     round_id: Mapped[str] = mapped_column(
@@ -74,8 +185,13 @@ class InvestmentParticipant(Base):
     )
     
     # Investment details
-    investment_type: Mapped[Optional[str]] = mapped_column(
-        String(50),
+    investment_type: Mapped[Optional[InvestmentType]] = mapped_column(
+        ENUM(
+            InvestmentType,
+            name='investment_type',
+            values_callable=lambda types: [t.value for t in types],
+            create_type=False,
+        ),
         nullable=True,
         comment='Type of investment (e.g., primary, secondary, follow-on)'
     )
@@ -137,15 +253,18 @@ class InvestmentParticipant(Base):
         nullable=True,
         comment='Additional notes about this investment'
     )
+    # JSONB blobs are deferred so list queries do not fetch and decode them
     external_ids: Mapped[Optional[Dict[str, str]]] = mapped_column(
         JSONB,
         nullable=True,
+        deferred=True,
         comment='External system identifiers (e.g., Crunchbase, PitchBook IDs)'
     )
     metadata_: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         'metadata',
         JSONB,
         nullable=True,
+        deferred=True,
         comment='Additional metadata and attributes'
     )
     
@@ -173,23 +292,50 @@ class InvestmentParticipant(Base):
     funding_round: Mapped['FundingRound'] = relationship(
         'FundingRound',
         back_populates='participants',
-        lazy='joined'
+        lazy='raise_on_sql'
     )
     investor: Mapped['Investor'] = relationship(
         'Investor',
         back_populates='investments',
-        lazy='joined',
+        lazy='raise_on_sql',
         passive_deletes=True
     )
     
     # Indexes
     __table_args__ = (
-        {'postgresql_using': 'btree', 'postgresql_ops': {'amount': 'DESC NULLS LAST'}},
-        {'postgresql_using': 'btree', 'postgresql_ops': {'is_lead': 'DESC'}},
+        # Participants of a round ordered by amount, largest first
+        Index(
+            'ix_ip_round_amount',
+            'round_id',
+            'amount',
+            postgresql_ops={'amount': 'DESC NULLS LAST'},
+        ),
+        # Lead investors of a round
+        Index(
+            'ix_ip_round_lead',
+            'round_id',
+            postgresql_where=text('is_lead'),
+        ),
+        # Reverse lookups by provider id through ``external_id_matches``
+        Index(
+            'ix_ip_external_ids_gin',
+            'external_ids',
+            postgresql_using='gin',
+            postgresql_ops={'external_ids': 'jsonb_path_ops'},
+        ),
+        {'comment': 'Investor participation in funding rounds'},
     )
     
     @property
     def investment_value(self) -> Optional[Decimal]:
+        """Investment value, cached until one of its inputs changes."""
+        try:
+            return self.__dict__[_INVESTMENT_VALUE_CACHE]
+        except KeyError:
+            value = self.__dict__[_INVESTMENT_VALUE_CACHE] = self._compute_investment_value()
+            return value
+
+    def _compute_investment_value(self) -> Optional[Decimal]:
         """Calculate the investment value based on shares and price."""
         if self.amount is not None:
             return self.amount
@@ -197,101 +343,209 @@ class InvestmentParticipant(Base):
             return Decimal(self.shares_issued) * self.share_price
         return None
     
+    @classmethod
+    def serialization_query(cls, include_related: bool = False) -> Select:
+        """Build a query that loads what ``to_dict`` reads.
+
+        ``external_ids`` is undeferred since ``to_dict`` emits it. Related
+        investors and funding rounds are only loaded, with SELECT IN
+        batches, when ``include_related`` is set; otherwise participants are
+        fetched on their own and touching a relationship raises.
+        """
+        query = select(cls).options(undefer(cls.external_ids))
+        if include_related:
+            query = query.options(
+                selectinload(cls.investor),
+                selectinload(cls.funding_round),
+            )
+        return query
+    
+    @classmethod
+    def list_rows(cls, session: Session, **filters: Any) -> List[Dict[str, Any]]:
+        """Fetch participants as plain dicts without building ORM instances.
+
+        Selects the scalar ``to_dict`` columns with Core, so list endpoints
+        skip identity-map and relationship bookkeeping and never read the
+        JSONB columns. ``investment_value`` is computed in SQL; rows match
+        ``to_dict(include_related=False)`` without ``external_ids``.
+
+        Args:
+            session: Database session to execute on.
+            **filters: Column equality filters, e.g. ``round_id='r1'``.
+
+        Raises:
+            ValueError: If a filter does not name an investment_participants column.
+        """
+        table = cls.__table__
+        unknown = set(filters) - set(table.c.keys())
+        if unknown:
+            raise ValueError(f"Unknown participant filter(s): {', '.join(sorted(unknown))}")
+        
+        query = select(*cls._list_columns()).where(
+            *(table.c[key] == value for key, value in filters.items())
+        )
+        result = session.execute(query)
+        keys = tuple(result.keys())
+        return [dict(zip(keys, row)) for row in result]
+    
+    @classmethod
+    def bulk_to_records(cls, session: Session, round_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Export the participants of ``round_ids`` as JSON-ready dicts.
+
+        For reports that walk every participant of many rounds. A single
+        SELECT returns the ``list_rows`` columns with Decimals cast to
+        ``float8`` and timestamps formatted as UTC ISO-8601 strings by
+        Postgres, so no per-row ``float()`` or ``isoformat()`` runs in Python.
+        """
+        columns = []
+        for column in cls._list_columns():
+            if column.key in _DECIMAL_FIELDS:
+                column = cast(column, Float).label(column.key)
+            elif column.key in _DATETIME_FIELDS:
+                column = func.to_char(
+                    func.timezone('UTC', column), _ISO_UTC_FORMAT
+                ).label(column.key)
+            columns.append(column)
+        
+        query = select(*columns).where(cls.__table__.c.round_id.in_(list(round_ids)))
+        result = session.execute(query)
+        keys = tuple(result.keys())
+        return [dict(zip(keys, row)) for row in result]
+    
+    @classmethod
+    def _list_columns(cls) -> List[ColumnElement[Any]]:
+        """Columns selected by ``list_rows``: the scalar ``to_dict`` fields."""
+        table = cls.__table__
+        investment_value = func.coalesce(
+            table.c.amount, table.c.shares_issued * table.c.share_price
+        ).label('investment_value')
+        return [
+            investment_value if key == 'investment_value' else table.c[key]
+            for key in _DICT_KEYS
+            if key != 'external_ids'
+        ]
+    
+    @classmethod
+    def external_id_matches(cls, provider: str, external_id: str) -> ColumnElement[bool]:
+        """Build a filter matching participants by a provider's external id.
+
+        Uses JSONB containment (``@>``) so the ``ix_ip_external_ids_gin``
+        index serves the lookup; ``->>`` comparisons cannot use it.
+        """
+        return cls.external_ids.contains({provider: external_id})
+    
     @validates('ownership_percentage')
     def validate_ownership_percentage(self, key, value):
         """Validate ownership percentage is between 0 and 100."""
-        if value is not None and (value < 0 or value > 100):
-            raise ValueError('Ownership percentage must be between 0 and 100')
-        return value
+        return _check_ownership_percentage(value)
     
     @validates('currency')
     def validate_currency(self, key, currency):
-        """Validate currency code format."""
-        if currency and len(currency) != 3:
-            raise ValueError('Currency code must be 3 characters')
-        return currency.upper() if currency else 'USD'
+        """Validate currency code against ISO 4217."""
+        return _normalize_currency(currency)
     
-    def update_from_api(self, data: Dict[str, Any]) -> None:
-        """Update participant data from API response."""
-        # Investment details
-        if 'investment_type' in data:
-            self.investment_type = data['investment_type']
-        if 'amount' in data:
-            self.amount = Decimal(str(data['amount'])) if data['amount'] is not None else None
-        if 'currency' in data:
-            self.currency = data['currency']
-        if 'shares_issued' in data:
-            self.shares_issued = int(data['shares_issued']) if data['shares_issued'] is not None else None
-        if 'share_price' in data:
-            self.share_price = Decimal(str(data['share_price'])) if data['share_price'] is not None else None
-        if 'ownership_percentage' in data:
-            self.ownership_percentage = float(data['ownership_percentage']) if data['ownership_percentage'] is not None else None
-        
-        # Status and role
-        if 'is_lead' in data:
-            self.is_lead = data['is_lead']
-        if 'is_board_seat' in data:
-            self.is_board_seat = data['is_board_seat']
-        if 'is_board_observer' in data:
-            self.is_board_observer = data['is_board_observer']
-        if 'is_pro_rata' in data:
-            self.is_pro_rata = data['is_pro_rata']
-        
-        # Additional metadata
-        self.notes = data.get('notes', self.notes)
-        
-        if 'external_ids' in data:
-            if self.external_ids:
-                self.external_ids.update(data['external_ids'])
-            else:
-                self.external_ids = data['external_ids']
+    @classmethod
+    def row_from_api(cls, round_id: str, data: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+        """Build an ``investment_participants`` row from an API payload.
+
+        For the Core upserts that bypass the unit of work: fields go through
+        the same coercers as ``update_from_api`` and the same checks as the
+        ``@validates`` hooks. Keys are column names, and fields absent from
+        ``data`` are left out so an upsert keeps their stored values.
+        ``external_ids`` holds only the payload's ids; the upsert merges
+        them into the stored ones.
+
+        Raises:
+            ValueError: If a field fails coercion or validation.
+        """
+        row: Dict[str, Any] = {
+            'round_id': round_id,
+            'investor_id': data['investor_id'],
+            'last_verified_at': now,
+        }
+        for field, value in data.items():
+            if field in _API_FIELD_COERCERS:
+                coerce = _API_FIELD_COERCERS[field]
+                row[field] = coerce(value) if coerce is not None else value
+            elif field in ('external_ids', 'metadata'):
+                row[field] = value
+        if 'currency' in row:
+            row['currency'] = _normalize_currency(row['currency'])
+        if 'ownership_percentage' in row:
+            _check_ownership_percentage(row['ownership_percentage'])
+        return row
+    
+    def update_from_api(self, data: Dict[str, Any], now: Optional[datetime] = None) -> None:
+        """Update participant data from API response.
+
+        Args:
+            data: API payload for this participant.
+            now: Verification timestamp to record; bulk syncs pass one value
+                for every participant instead of reading the clock per row.
+                Defaults to the current UTC time.
+        """
+        for field, value in data.items():
+            if field in _API_FIELD_COERCERS:
+                coerce = _API_FIELD_COERCERS[field]
+                setattr(self, field, coerce(value) if coerce is not None else value)
+            elif field == 'external_ids':
+                # Reassign rather than update in place so the change is tracked
+                self.external_ids = {**(self.external_ids or {}), **(value or {})}
+            elif field == 'metadata':
+                self.metadata_ = value
         
         # Update verification timestamp
-        self.last_verified_at = datetime.utcnow()
+        self.last_verified_at = now or datetime.now(timezone.utc)
     
-    def to_dict(self, include_related: bool = True) -> Dict[str, Any]:
-        """Convert investment participant to dictionary representation."""
-        result = {
-            'round_id': self.round_id,
-            'investor_id': self.investor_id,
-            'investment_type': self.investment_type,
-            'amount': float(self.amount) if self.amount is not None else None,
-            'currency': self.currency,
-            'shares_issued': self.shares_issued,
-            'share_price': float(self.share_price) if self.share_price is not None else None,
-            'ownership_percentage': float(self.ownership_percentage) if self.ownership_percentage is not None else None,
-            'investment_value': float(self.investment_value) if self.investment_value is not None else None,
-            'is_lead': self.is_lead,
-            'is_board_seat': self.is_board_seat,
-            'is_board_observer': self.is_board_observer,
-            'is_pro_rata': self.is_pro_rata,
-            'notes': self.notes,
-            'external_ids': self.external_ids,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat(),
-            'last_verified_at': self.last_verified_at.isoformat() if self.last_verified_at else None,
-        }
+    def to_dict(self, include_related: bool = True, json_compatible: bool = False) -> Dict[str, Any]:
+        """Convert investment participant to dictionary representation.
+
+        Decimals and datetimes are returned as-is, which orjson encodes
+        directly. Pass ``json_compatible=True`` for callers that need floats
+        and ISO-8601 strings.
+
+        Both relationships are ``raise_on_sql``, so ``include_related`` only
+        nests the investor and funding round that are already loaded, e.g.
+        through ``serialization_query(include_related=True)``.
+        """
+        result = dict(zip(_DICT_KEYS, _get_dict_fields(self)))
         
         if include_related:
-            if self.investor:
-                result['investor'] = {
-                    'id': self.investor.id,
-                    'name': self.investor.name,
-                    'type': self.investor.investor_type.value if self.investor.investor_type else None,
-                    'website': self.investor.website,
-                    'linkedin_url': self.investor.linkedin_url,
-                }
-            if self.funding_round:
-                result['funding_round'] = {
-                    'id': self.funding_round.id,
-                    'name': self.funding_round.name,
-                    'round_type': self.funding_round.round_type.value if self.funding_round.round_type else None,
-                    'announced_date': self.funding_round.announced_date.isoformat() if self.funding_round.announced_date else None,
-                    'company_id': self.funding_round.company_id,
-                }
+            loaded = inspect(self).dict
+            investor = loaded.get('investor')
+            if investor:
+                result['investor'] = dict(zip(_INVESTOR_KEYS, _get_investor_fields(investor)))
+            funding_round = loaded.get('funding_round')
+            if funding_round:
+                related = dict(zip(_FUNDING_ROUND_KEYS, _get_funding_round_fields(funding_round)))
+                if related['round_type']:
+                    related['round_type'] = related['round_type'].value
+                result['funding_round'] = related
+        
+        if json_compatible:
+            for key in _DECIMAL_FIELDS:
+                result[key] = float(result[key]) if result[key] is not None else None
+            for key in _DATETIME_FIELDS:
+                result[key] = result[key].isoformat() if result[key] else None
+            if 'funding_round' in result:
+                announced_date = result['funding_round']['announced_date']
+                result['funding_round']['announced_date'] = announced_date.isoformat() if announced_date else None
         
         return result
 
+    def to_json_bytes(self, include_related: bool = True) -> bytes:
+        """Serialize the participant straight to JSON bytes.
+
+        orjson encodes datetimes natively and Decimals through
+        ``_encode_participant``, skipping the conversions done by
+        ``to_dict(json_compatible=True)``.
+        """
+        return orjson.dumps(
+            self.to_dict(include_related),
+            default=_encode_participant,
+            option=orjson.OPT_NAIVE_UTC,
+        )
+
     def __repr__(self) -> str:
         return (
             f"<InvestmentParticipant(round_id={self.round_id}, "
@@ -299,3 +553,18 @@ class InvestmentParticipant(Base):
             f"amount={self.amount} {self.currency}, "
             f"shares={self.shares_issued}@{self.share_price})"
         )
+
+
+def _clear_investment_value(target: InvestmentParticipant, *args: Any) -> None:
+    """Drop the memoized ``investment_value`` so it is recomputed on next access."""
+    target.__dict__.pop(_INVESTMENT_VALUE_CACHE, None)
+
+
+for _attr in (
+    InvestmentParticipant.amount,
+    InvestmentParticipant.shares_issued,
+    InvestmentParticipant.share_price,
+):
+    event.listen(_attr, 'set', _clear_investment_value)
+event.listen(InvestmentParticipant, 'refresh', _clear_investment_value)
+event.listen(InvestmentParticipant, 'expire', _clear_investment_value)
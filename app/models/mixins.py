@@ -0,0 +1,20 @@
+"""Mixins shared by the SQLAlchemy models."""
+from typing import Any
+
+
+class ApiSyncMixin:
+    """Helpers for models that are updated in place from external API payloads."""
+
+    def _setattr_if_changed(self, attr: str, value: Any) -> bool:
+        """Assign ``value`` to ``attr`` only if it differs from the current value.
+
+        Skipping equal assignments keeps unchanged attributes out of the
+        unit of work, so a sync that changes nothing emits no UPDATE.
+
+        Returns:
+            True if the attribute was modified.
+        """
+        if getattr(self, attr) == value:
+            return False
+        setattr(self, attr, value)
+        return True
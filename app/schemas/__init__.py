@@ -28,12 +28,15 @@ from app.schemas.funding_round import (
     FundingRoundUpdate,
     FundingRoundInDB,
     FundingRoundWithRelations,
+    INVESTMENT_TYPE_VALUES,
+    ROUND_TYPE_VALUES,
 )
 from app.schemas.investment_participant import (
     InvestmentParticipant,
     InvestmentParticipantCreate,
     InvestmentParticipantUpdate,
     InvestmentParticipantInDB,
+    PARTICIPANT_ROLE_VALUES,
 )
 
 __all__ = [
@@ -69,9 +72,12 @@ __all__ = [
     "FundingRoundUpdate",
     "FundingRoundInDB",
     "FundingRoundWithRelations",
+    "INVESTMENT_TYPE_VALUES",
+    "ROUND_TYPE_VALUES",
     # Investment Participant
     "InvestmentParticipant",
     "InvestmentParticipantCreate",
     "InvestmentParticipantUpdate",
     "InvestmentParticipantInDB",
+    "PARTICIPANT_ROLE_VALUES",
 ]
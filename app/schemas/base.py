@@ -1,13 +1,118 @@
 """Base Pydantic models for the API."""
-from datetime import datetime
-from typing import Any, Dict, Generic, Optional, TypeVar
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, Generic, Iterable, Optional, Tuple, Type, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, PlainSerializer, computed_field, create_model
 from pydantic.alias_generators import to_camel
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated
 
 # Generic type for the ID field
 T = TypeVar('T')
 
+# Decimal emitted as a JSON number; serialized by pydantic-core, and left as
+# a Decimal in python-mode dumps
+FloatDecimal = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used='json')]
+
+# Positive USD amount; a single constrained decimal schema shared by every
+# money field instead of one per Field(...) declaration
+USDAmount = Annotated[FloatDecimal, Field(gt=0, max_digits=20, decimal_places=2)]
+OptUSDAmount = Optional[USDAmount]
+# Bound for the min/max amount range filters
+PositiveDecimal = Annotated[Decimal, Field(gt=0)]
+
+# Twitter username with any leading @ removed; None skips the cleaner entirely
+TwitterHandle = Annotated[str, AfterValidator(lambda v: v.lstrip('@'))]
+
+# Sentinel for attributes missing from an ORM object
+_MISSING = object()
+
+
+@lru_cache(maxsize=1)
+def _today_for_minute(minute: int) -> date:
+    return date.today()
+
+
+def cached_today() -> date:
+    """Return today's date, read from the clock at most once a minute.
+
+    Used by "not in the future" validators that run once per row in bulk
+    payloads; just after midnight the previous date may be returned for
+    up to a minute.
+    """
+    return _today_for_minute(int(time.time() // 60))
+
+
+def _optional_field(info: FieldInfo) -> Tuple[Any, Any]:
+    """Build the ``(annotation, Field)`` pair for an optional copy of a field.
+
+    Constraints stay on the inner type so they apply to non-null values;
+    the documentation attributes are passed to a new ``Field`` whose
+    default is ``None``.
+    """
+    annotation = info.annotation
+    if info.metadata:
+        annotation = Annotated[(annotation, *info.metadata)]
+    return Optional[annotation], Field(
+        default=None,
+        alias=info.alias,
+        title=info.title,
+        description=info.description,
+        examples=info.examples,
+        json_schema_extra=info.json_schema_extra,
+    )
+
+
+def make_partial(
+    model: Type[BaseModel],
+    name: str,
+    *,
+    exclude: Iterable[str] = (),
+    doc: Optional[str] = None,
+) -> Type[BaseModel]:
+    """Build an update schema in which every field of ``model`` is optional.
+
+    Field constraints and descriptions are kept, defaults become ``None``
+    and ``model``'s validators are not carried over. The core schema is
+    built on first use rather than at import. Fields that only the update
+    schema accepts are declared on a subclass of the result.
+
+    Args:
+        model: Schema whose fields are copied.
+        name: Name of the generated schema.
+        exclude: Fields of ``model`` left out of the generated schema.
+        doc: Docstring of the generated schema.
+    """
+    skip = set(exclude)
+    fields = {
+        field_name: _optional_field(info)
+        for field_name, info in model.model_fields.items()
+        if field_name not in skip
+    }
+    return create_model(
+        name,
+        __config__=ConfigDict(defer_build=True),
+        __doc__=doc,
+        __module__=model.__module__,
+        **fields,
+    )
+
+
+# Config for read-only response schemas: instances are built once and
+# serialized, never mutated, and reject fields the schema does not declare.
+# Core schemas are built on first use rather than at import.
+RESPONSE_CONFIG = ConfigDict(
+    defer_build=True,
+    frozen=True,
+    extra='forbid',
+    validate_assignment=False,
+    revalidate_instances='never',
+    from_attributes=True,
+)
+
 
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
@@ -34,6 +139,25 @@ class TimestampMixin(BaseModel):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
+class TrustedORMMixin(BaseModel):
+    """Mixin for schemas hydrated from ORM rows that are already valid."""
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> Any:
+        """Build the schema from ``obj`` without running validators.
+
+        Only for rows read back from the database, which already satisfy the
+        schema; client input must go through ``model_validate``. Fields the
+        object does not have fall back to their defaults.
+        """
+        values = {}
+        for name in cls.model_fields:
+            value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+        return cls.model_construct(**values)
+
+
 class BaseResponseSchema(BaseSchema):
     """Base response schema with success flag and message."""
     success: bool = Field(True, description="Indicates if the request was successful")
@@ -53,20 +177,14 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     total: int = Field(..., description="Total number of items")
     page: int = Field(1, description="Current page number")
     page_size: int = Field(10, description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
 
-    @model_validator(mode='after')
-    def calculate_total_pages(self) -> 'PaginatedResponse[T]':
+    @computed_field(description="Total number of pages")
+    @property
+    def total_pages(self) -> int:
         """Calculate total pages based on total items and page size."""
-        if self.total_pages is not None:
-            return self
-            
         if self.page_size <= 0:
-            self.total_pages = 1
-        else:
-            self.total_pages = (self.total + self.page_size - 1) // self.page_size
-            
-        return self
+            return 1
+        return (self.total + self.page_size - 1) // self.page_size
 
 
 class QueryParams(BaseSchema):
@@ -75,7 +193,7 @@ class QueryParams(BaseSchema):
     skip: int = Field(0, ge=0, description="Number of items to skip")
     limit: int = Field(100, ge=1, le=1000, description="Maximum number of items to return")
     sort_by: Optional[str] = Field(None, description="Field to sort by")
-    sort_order: str = Field("asc", regex="^(asc|desc)$", description="Sort order (asc or desc)")
+    sort_order: str = Field("asc", pattern="^(asc|desc)$", description="Sort order (asc or desc)")
 
 
 class BulkOperationResponse(BaseSchema):
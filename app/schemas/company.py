@@ -1,12 +1,22 @@
 """Company related schemas."""
+import re
 from datetime import date, datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
 from app.schemas.base import IDSchemaMixin, TimestampMixin
 
+_URL_RE = re.compile(r'^https?://[^\s]+$')
+
+
+def _validate_website(v: Optional[str]) -> Optional[str]:
+    """Ensure a website, when given, is an http(s) URL without whitespace."""
+    if v and not _URL_RE.match(v):
+        raise ValueError("Website must be a valid http(s) URL")
+    return v
+
 
 class CompanyStatus(str, Enum):
     """Company status enumeration."""
@@ -21,7 +31,7 @@ class CompanyBase(BaseModel):
     """Base company schema with common fields."""
     name: str = Field(..., max_length=255, description="Company name")
     description: Optional[str] = Field(None, description="Company description")
-    website: Optional[HttpUrl] = Field(None, description="Company website URL")
+    website: Optional[str] = Field(None, description="Company website URL")
     founded_date: Optional[date] = Field(None, description="Date when the company was founded")
     status: Optional[CompanyStatus] = Field(None, description="Company status")
     total_funding: Optional[float] = Field(
@@ -57,6 +67,12 @@ class CompanyBase(BaseModel):
             raise ValueError("Name cannot be empty")
         return v.strip()
 
+    @field_validator('website')
+    @classmethod
+    def website_must_be_url(cls, v: Optional[str]) -> Optional[str]:
+        """Ensure website is an http(s) URL."""
+        return _validate_website(v)
+
 
 # Properties to receive on company creation
 class CompanyCreate(CompanyBase):
@@ -69,7 +85,7 @@ class CompanyUpdate(BaseModel):
     """Schema for updating an existing company."""
     name: Optional[str] = Field(None, max_length=255, description="Company name")
     description: Optional[str] = Field(None, description="Company description")
-    website: Optional[HttpUrl] = Field(None, description="Company website URL")
+    website: Optional[str] = Field(None, description="Company website URL")
     founded_date: Optional[date] = Field(None, description="Date when the company was founded")
     status: Optional[CompanyStatus] = Field(None, description="Company status")
     total_funding: Optional[float] = Field(
@@ -97,12 +113,17 @@ class CompanyUpdate(BaseModel):
         description="Headquarters city"
     )
 
+    @field_validator('website')
+    @classmethod
+    def website_must_be_url(cls, v: Optional[str]) -> Optional[str]:
+        """Ensure website is an http(s) URL."""
+        return _validate_website(v)
+
 
 # Properties shared by models stored in DB
 class CompanyInDBBase(IDSchemaMixin, TimestampMixin, CompanyBase):
     """Base schema for company data stored in the database."""
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Properties to return to client
@@ -151,6 +172,10 @@ class CompanyBulkCreate(BaseModel):
     companies: List[CompanyCreate] = Field(..., description="List of companies to create")
 
 
+# Validates a whole batch of raw company payloads in a single call
+COMPANY_LIST_ADAPTER = TypeAdapter(List[CompanyCreate])
+
+
 class CompanyBulkUpdate(BaseModel):
     """Schema for bulk updating companies."""
     companies: List[dict] = Field(..., description="List of company updates with IDs")
@@ -201,47 +226,31 @@ class CompanyFilters(BaseModel):
         description="Filter companies that have received funding"
     )
     
-    @field_validator('max_funding')
-    @classmethod
-    def validate_funding_range(
-        cls, 
-        v: Optional[float], 
-        values: dict
-    ) -> Optional[float]:
-        """Validate that max_funding is greater than min_funding if both are provided."""
-        if v is not None and 'min_funding' in values and values['min_funding'] is not None:
-            if v < values['min_funding']:
-                raise ValueError(
-                    "max_funding must be greater than or equal to min_funding"
-                )
-        return v
-    
-    @field_validator('max_employees')
-    @classmethod
-    def validate_employees_range(
-        cls, 
-        v: Optional[int], 
-        values: dict
-    ) -> Optional[int]:
-        """Validate that max_employees is greater than min_employees if both are provided."""
-        if v is not None and 'min_employees' in values and values['min_employees'] is not None:
-            if v < values['min_employees']:
-                raise ValueError(
-                    "max_employees must be greater than or equal to min_employees"
-                )
-        return v
-    
-    @field_validator('founded_before')
-    @classmethod
-    def validate_founded_dates(
-        cls, 
-        v: Optional[date], 
-        values: dict
-    ) -> Optional[date]:
-        """Validate that founded_before is after founded_after if both are provided."""
-        if v is not None and 'founded_after' in values and values['founded_after'] is not None:
-            if v < values['founded_after']:
-                raise ValueError(
-                    "founded_before must be after founded_after"
-                )
-        return v
+    @model_validator(mode='after')
+    def validate_ranges(self) -> 'CompanyFilters':
+        """Validate that each max/before bound is not below its min/after bound."""
+        if (
+            self.max_funding is not None
+            and self.min_funding is not None
+            and self.max_funding < self.min_funding
+        ):
+            raise ValueError(
+                "max_funding must be greater than or equal to min_funding"
+            )
+        if (
+            self.max_employees is not None
+            and self.min_employees is not None
+            and self.max_employees < self.min_employees
+        ):
+            raise ValueError(
+                "max_employees must be greater than or equal to min_employees"
+            )
+        if (
+            self.founded_before is not None
+            and self.founded_after is not None
+            and self.founded_before < self.founded_after
+        ):
+            raise ValueError(
+                "founded_before must be after founded_after"
+            )
+        return self
@@ -1,11 +1,11 @@
 """Founder related schemas."""
 from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, HttpUrl, TypeAdapter, field_validator
 
-from app.schemas.base import IDSchemaMixin, TimestampMixin
+from app.schemas.base import RESPONSE_CONFIG, IDSchemaMixin, TimestampMixin, TrustedORMMixin, TwitterHandle, make_partial
 
 
 class FounderRole(str, Enum):
@@ -24,7 +24,7 @@ class FounderBase(BaseModel):
     last_name: str = Field(..., max_length=100, description="Founder's last name")
     email: Optional[EmailStr] = Field(None, description="Founder's email address")
     linkedin_url: Optional[HttpUrl] = Field(None, description="LinkedIn profile URL")
-    twitter_handle: Optional[str] = Field(
+    twitter_handle: Optional[TwitterHandle] = Field(
         None, 
         max_length=50, 
         description="Twitter username (without @)"
@@ -53,15 +53,6 @@ class FounderBase(BaseModel):
         description="Date when the founder left the company (if applicable)"
     )
     
-    @field_validator('twitter_handle')
-    @classmethod
-    def clean_twitter_handle(cls, v: Optional[str]) -> Optional[str]:
-        """Clean and validate Twitter handle."""
-        if not v:
-            return v
-        # Remove @ symbol if present
-        return v.lstrip('@')
-    
     @field_validator('end_date')
     @classmethod
     def validate_dates(
@@ -83,48 +74,11 @@ class FounderCreate(FounderBase):
 
 
 # Properties to receive on founder update
-class FounderUpdate(BaseModel):
+_FounderPartial = make_partial(FounderBase, '_FounderPartial')
+
+
+class FounderUpdate(_FounderPartial):
     """Schema for updating an existing founder."""
-    first_name: Optional[str] = Field(
-        None, 
-        max_length=100, 
-        description="Founder's first name"
-    )
-    last_name: Optional[str] = Field(
-        None, 
-        max_length=100, 
-        description="Founder's last name"
-    )
-    email: Optional[EmailStr] = Field(None, description="Founder's email address")
-    linkedin_url: Optional[HttpUrl] = Field(None, description="LinkedIn profile URL")
-    twitter_handle: Optional[str] = Field(
-        None, 
-        max_length=50, 
-        description="Twitter username (without @)"
-    )
-    bio: Optional[str] = Field(None, description="Short biography")
-    photo_url: Optional[HttpUrl] = Field(None, description="URL to founder's photo")
-    is_current: Optional[bool] = Field(
-        None, 
-        description="Whether the founder is currently with the company"
-    )
-    role: Optional[FounderRole] = Field(
-        None, 
-        description="Founder's role in the company"
-    )
-    title: Optional[str] = Field(
-        None, 
-        max_length=100, 
-        description="Founder's title at the company"
-    )
-    start_date: Optional[date] = Field(
-        None, 
-        description="Date when the founder joined the company"
-    )
-    end_date: Optional[date] = Field(
-        None, 
-        description="Date when the founder left the company (if applicable)"
-    )
     company_id: Optional[int] = Field(None, description="ID of the company")
 
 
@@ -140,11 +94,11 @@ class FounderInDBBase(IDSchemaMixin, TimestampMixin, FounderBase):
 # Properties to return to client
 class Founder(FounderInDBBase):
     """Founder schema for API responses."""
-    pass
+    model_config = RESPONSE_CONFIG
 
 
 # Properties stored in DB
-class FounderInDB(FounderInDBBase):
+class FounderInDB(TrustedORMMixin, FounderInDBBase):
     """Founder schema for database operations."""
     pass
 
@@ -152,8 +106,8 @@ class FounderInDB(FounderInDBBase):
 # Additional properties to return via API
 class FounderWithRelations(Founder):
     """Founder schema with related entities."""
-    company: Optional[dict] = Field(None, description="Company details")
-    previous_companies: List[dict] = Field(
+    company: Optional[Any] = Field(None, description="Company details")
+    previous_companies: List[Any] = Field(
         default_factory=list, 
         description="List of previous companies"
     )
@@ -162,6 +116,8 @@ class FounderWithRelations(Founder):
 # Request/Response models for founder operations
 class FounderResponse(BaseModel):
     """Generic founder operation response."""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(..., description="Operation status")
     message: str = Field(..., description="Result message")
     founder: Optional[Founder] = Field(None, description="Founder details")
@@ -169,6 +125,8 @@ class FounderResponse(BaseModel):
 
 class FoundersResponse(BaseModel):
     """Response for listing multiple founders."""
+    model_config = RESPONSE_CONFIG
+
     success: bool = Field(..., description="Operation status")
     count: int = Field(..., description="Number of founders")
     founders: List[Founder] = Field(..., description="List of founders")
@@ -177,17 +135,32 @@ class FoundersResponse(BaseModel):
 # Request/Response models for bulk operations
 class FounderBulkCreate(BaseModel):
     """Schema for bulk creating founders."""
+    model_config = ConfigDict(defer_build=True)
+
     founders: List[FounderCreate] = Field(..., description="List of founders to create")
 
 
+# Validates a whole batch of raw founder payloads in a single call
+FOUNDER_LIST_ADAPTER = TypeAdapter(List[FounderCreate])
+
+
+class FounderBulkUpdateItem(FounderUpdate):
+    """Single founder update within a bulk update."""
+    id: int = Field(..., description="Founder ID")
+
+
 class FounderBulkUpdate(BaseModel):
     """Schema for bulk updating founders."""
-    founders: List[dict] = Field(..., description="List of founder updates with IDs")
+    model_config = ConfigDict(defer_build=True)
+
+    founders: List[FounderBulkUpdateItem] = Field(..., description="List of founder updates with IDs")
 
 
 # Search and filter models
 class FounderFilters(BaseModel):
     """Filters for querying founders."""
+    model_config = ConfigDict(defer_build=True)
+
     company_id: Optional[int] = Field(None, description="Filter by company ID")
     is_current: Optional[bool] = Field(
         None, 
@@ -210,11 +183,15 @@ class FounderFilters(BaseModel):
         None, 
         description="Filter by presence of Twitter handle"
     )
-    
-    @field_validator('min_experience')
-    @classmethod
-    def validate_experience(cls, v: Optional[int]) -> Optional[int]:
-        """Validate that experience is non-negative."""
-        if v is not None and v < 0:
-            raise ValueError("min_experience cannot be negative")
-        return v
+
+
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+
+def warm_up_email_validation() -> None:
+    """Validate one address so email-validator sets up its internals.
+
+    The first address it checks costs several ms; the application lifespan
+    calls this at startup so the cost does not land on the first request.
+    """
+    _EMAIL_ADAPTER.validate_python('warmup@example.com')
@@ -1,12 +1,21 @@
 """Funding round related schemas."""
 from datetime import date, datetime
-from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, TypeAdapter, field_validator, model_validator
 
-from app.schemas.base import IDSchemaMixin, TimestampMixin
+from app.schemas.base import (
+    RESPONSE_CONFIG,
+    IDSchemaMixin,
+    OptUSDAmount,
+    PositiveDecimal,
+    TimestampMixin,
+    TrustedORMMixin,
+    USDAmount,
+    cached_today,
+    make_partial,
+)
 
 
 class RoundType(str, Enum):
@@ -42,6 +51,10 @@ class RoundType(str, Enum):
     OTHER = "OTHER"
 
 
+# Plain-string membership checks without going through EnumMeta
+ROUND_TYPE_VALUES = frozenset(rt.value for rt in RoundType)
+
+
 class InvestmentType(str, Enum):
     """Investment type enumeration."""
     EQUITY = "EQUITY"
@@ -55,6 +68,9 @@ class InvestmentType(str, Enum):
     OTHER = "OTHER"
 
 
+INVESTMENT_TYPE_VALUES = frozenset(it.value for it in InvestmentType)
+
+
 # Shared properties
 class FundingRoundBase(BaseModel):
     """Base funding round schema with common fields."""
@@ -62,32 +78,17 @@ class FundingRoundBase(BaseModel):
     round_type: RoundType = Field(..., description="Type of funding round")
     investment_type: InvestmentType = Field(..., description="Type of investment")
     announced_date: date = Field(..., description="Date the round was announced")
-    raised_amount: Decimal = Field(
-        ..., 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
-        description="Amount raised in USD"
-    )    
-    valuation: Optional[Decimal] = Field(
+    raised_amount: USDAmount = Field(..., description="Amount raised in USD")
+    valuation: OptUSDAmount = Field(
         None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
         description="Valuation in USD (if available)"
     )
-    pre_money_valuation: Optional[Decimal] = Field(
+    pre_money_valuation: OptUSDAmount = Field(
         None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
         description="Pre-money valuation in USD (if available)"
     )
-    post_money_valuation: Optional[Decimal] = Field(
+    post_money_valuation: OptUSDAmount = Field(
         None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
         description="Post-money valuation in USD (if available)"
     )
     is_equity: bool = Field(
@@ -123,18 +124,21 @@ class FundingRoundBase(BaseModel):
     @model_validator(mode='after')
     def validate_valuations(self) -> 'FundingRoundBase':
         """Validate that post_money_valuation >= pre_money_valuation + raised_amount."""
-        if self.pre_money_valuation is not None and self.post_money_valuation is not None:
-            if self.post_money_valuation < self.pre_money_valuation + self.raised_amount:
-                raise ValueError(
-                    "post_money_valuation must be >= pre_money_valuation + raised_amount"
-                )
+        pre_money = self.pre_money_valuation
+        post_money = self.post_money_valuation
+        if pre_money is None or post_money is None or self.raised_amount is None:
+            return self
+        if post_money < pre_money + self.raised_amount:
+            raise ValueError(
+                "post_money_valuation must be >= pre_money_valuation + raised_amount"
+            )
         return self
     
     @field_validator('announced_date')
     @classmethod
     def validate_announced_date(cls, v: date) -> date:
         """Validate that announced date is not in the future."""
-        if v > date.today():
+        if v > cached_today():
             raise ValueError("announced_date cannot be in the future")
         return v
 
@@ -149,74 +153,11 @@ class FundingRoundCreate(FundingRoundBase):
 
 
 # Properties to receive on funding round update
-class FundingRoundUpdate(BaseModel):
+_FundingRoundPartial = make_partial(FundingRoundBase, '_FundingRoundPartial', exclude=('company_id',))
+
+
+class FundingRoundUpdate(_FundingRoundPartial):
     """Schema for updating an existing funding round."""
-    round_type: Optional[RoundType] = Field(None, description="Type of funding round")
-    investment_type: Optional[InvestmentType] = Field(
-        None, 
-        description="Type of investment"
-    )
-    announced_date: Optional[date] = Field(
-        None, 
-        description="Date the round was announced"
-    )
-    raised_amount: Optional[Decimal] = Field(
-        None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
-        description="Amount raised in USD"
-    )
-    valuation: Optional[Decimal] = Field(
-        None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
-        description="Valuation in USD (if available)"
-    )
-    pre_money_valuation: Optional[Decimal] = Field(
-        None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
-        description="Pre-money valuation in USD (if available)"
-    )
-    post_money_valuation: Optional[Decimal] = Field(
-        None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
-        description="Post-money valuation in USD (if available)"
-    )
-    is_equity: Optional[bool] = Field(
-        None, 
-        description="Whether this is an equity round"
-    )
-    is_debt: Optional[bool] = Field(
-        None, 
-        description="Whether this is a debt round"
-    )
-    is_convertible: Optional[bool] = Field(
-        None, 
-        description="Whether this is a convertible note/SAFE"
-    )
-    is_announced: Optional[bool] = Field(
-        None, 
-        description="Whether this round has been publicly announced"
-    )
-    source_url: Optional[HttpUrl] = Field(
-        None, 
-        description="URL of the announcement or source"
-    )
-    source_name: Optional[str] = Field(
-        None, 
-        max_length=255, 
-        description="Name of the source"
-    )
-    notes: Optional[str] = Field(
-        None, 
-        description="Additional notes about the round"
-    )
     investor_ids: Optional[List[int]] = Field(
         None,
         description="List of investor IDs participating in this round"
@@ -226,21 +167,17 @@ class FundingRoundUpdate(BaseModel):
 # Properties shared by models stored in DB
 class FundingRoundInDBBase(IDSchemaMixin, TimestampMixin, FundingRoundBase):
     """Base schema for funding round data stored in the database."""
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            Decimal: lambda v: float(v) if v is not None else None
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Properties to return to client
 class FundingRound(FundingRoundInDBBase):
     """Funding round schema for API responses."""
-    pass
+    model_config = RESPONSE_CONFIG
 
 
 # Properties stored in DB
-class FundingRoundInDB(FundingRoundInDBBase):
+class FundingRoundInDB(TrustedORMMixin, FundingRoundInDBBase):
     """Funding round schema for database operations."""
     pass
 
@@ -248,8 +185,8 @@ class FundingRoundInDB(FundingRoundInDBBase):
 # Additional properties to return via API
 class FundingRoundWithRelations(FundingRound):
     """Funding round schema with related entities."""
-    company: Optional[dict] = Field(None, description="Company details")
-    investors: List[dict] = Field(
+    company: Optional[Any] = Field(None, description="Company details")
+    investors: List[Any] = Field(
         default_factory=list, 
         description="List of investors in this round"
     )
@@ -258,6 +195,8 @@ class FundingRoundWithRelations(FundingRound):
 # Request/Response models for funding round operations
 class FundingRoundResponse(BaseModel):
     """Generic funding round operation response."""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(..., description="Operation status")
     message: str = Field(..., description="Result message")
     funding_round: Optional[FundingRound] = Field(
@@ -268,6 +207,8 @@ class FundingRoundResponse(BaseModel):
 
 class FundingRoundsResponse(BaseModel):
     """Response for listing multiple funding rounds."""
+    model_config = RESPONSE_CONFIG
+
     success: bool = Field(..., description="Operation status")
     count: int = Field(..., description="Number of funding rounds")
     funding_rounds: List[FundingRound] = Field(
@@ -279,15 +220,28 @@ class FundingRoundsResponse(BaseModel):
 # Request/Response models for bulk operations
 class FundingRoundBulkCreate(BaseModel):
     """Schema for bulk creating funding rounds."""
+    model_config = ConfigDict(defer_build=True)
+
     funding_rounds: List[FundingRoundCreate] = Field(
         ..., 
         description="List of funding rounds to create"
     )
 
 
+# Validates a whole batch of raw funding round payloads in a single call
+FUNDING_ROUND_LIST_ADAPTER = TypeAdapter(List[FundingRoundCreate])
+
+
+class FundingRoundBulkUpdateItem(FundingRoundUpdate):
+    """Single funding round update within a bulk update."""
+    id: int = Field(..., description="Funding round ID")
+
+
 class FundingRoundBulkUpdate(BaseModel):
     """Schema for bulk updating funding rounds."""
-    funding_rounds: List[dict] = Field(
+    model_config = ConfigDict(defer_build=True)
+
+    funding_rounds: List[FundingRoundBulkUpdateItem] = Field(
         ..., 
         description="List of funding round updates with IDs"
     )
@@ -296,6 +250,8 @@ class FundingRoundBulkUpdate(BaseModel):
 # Search and filter models
 class FundingRoundFilters(BaseModel):
     """Filters for querying funding rounds."""
+    model_config = ConfigDict(defer_build=True)
+
     company_id: Optional[int] = Field(
         None, 
         description="Filter by company ID"
@@ -312,24 +268,20 @@ class FundingRoundFilters(BaseModel):
         None, 
         description="Filter by investment type"
     )
-    min_raised: Optional[Decimal] = Field(
+    min_raised: Optional[PositiveDecimal] = Field(
         None, 
-        gt=0, 
         description="Minimum amount raised"
     )
-    max_raised: Optional[Decimal] = Field(
+    max_raised: Optional[PositiveDecimal] = Field(
         None, 
-        gt=0, 
         description="Maximum amount raised"
     )
-    min_valuation: Optional[Decimal] = Field(
+    min_valuation: Optional[PositiveDecimal] = Field(
         None, 
-        gt=0, 
         description="Minimum valuation"
     )
-    max_valuation: Optional[Decimal] = Field(
+    max_valuation: Optional[PositiveDecimal] = Field(
         None, 
-        gt=0, 
         description="Maximum valuation"
     )
     start_date: Optional[date] = Field(
@@ -357,45 +309,31 @@ class FundingRoundFilters(BaseModel):
         description="Filter by announcement status"
     )
     
-    @field_validator('max_raised')
-    @classmethod
-    def validate_raised_range(
-        cls, 
-        v: Optional[Decimal], 
-        values: dict
-    ) -> Optional[Decimal]:
-        """Validate that max_raised is greater than min_raised if both are provided."""
-        if v is not None and 'min_raised' in values and values['min_raised'] is not None:
-            if v < values['min_raised']:
-                raise ValueError(
-                    "max_raised must be greater than or equal to min_raised"
-                )
-        return v
-    
-    @field_validator('max_valuation')
-    @classmethod
-    def validate_valuation_range(
-        cls, 
-        v: Optional[Decimal], 
-        values: dict
-    ) -> Optional[Decimal]:
-        """Validate that max_valuation is greater than min_valuation if both are provided."""
-        if v is not None and 'min_valuation' in values and values['min_valuation'] is not None:
-            if v < values['min_valuation']:
-                raise ValueError(
-                    "max_valuation must be greater than or equal to min_valuation"
-                )
-        return v
-    
-    @field_validator('end_date')
-    @classmethod
-    def validate_date_range(
-        cls, 
-        v: Optional[date], 
-        values: dict
-    ) -> Optional[date]:
-        """Validate that end_date is after start_date if both are provided."""
-        if v is not None and 'start_date' in values and values['start_date'] is not None:
-            if v < values['start_date']:
-                raise ValueError("end_date must be after start_date")
-        return v
+    @model_validator(mode='after')
+    def validate_ranges(self) -> 'FundingRoundFilters':
+        """Validate that each max/end bound is not below its min/start bound."""
+        if (
+            self.max_raised is not None
+            and self.min_raised is not None
+            and self.max_raised < self.min_raised
+        ):
+            raise ValueError(
+                "max_raised must be greater than or equal to min_raised"
+            )
+        if (
+            self.max_valuation is not None
+            and self.min_valuation is not None
+            and self.max_valuation < self.min_valuation
+        ):
+            raise ValueError(
+                "max_valuation must be greater than or equal to min_valuation"
+            )
+        if (
+            self.end_date is not None
+            and self.start_date is not None
+            and self.end_date < self.start_date
+        ):
+            raise ValueError(
+                "end_date must be after start_date"
+            )
+        return self
@@ -2,11 +2,25 @@
 from datetime import date
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+from typing_extensions import Annotated
 
-from app.schemas.base import IDSchemaMixin, TimestampMixin
+from app.schemas.base import (
+    RESPONSE_CONFIG,
+    FloatDecimal,
+    IDSchemaMixin,
+    OptUSDAmount,
+    PositiveDecimal,
+    TimestampMixin,
+    TrustedORMMixin,
+    cached_today,
+    make_partial,
+)
+
+# Per-share prices carry more precision than whole USD amounts
+SharePrice = Annotated[FloatDecimal, Field(gt=0, max_digits=20, decimal_places=10)]
 
 
 class ParticipantRole(str, Enum):
@@ -26,17 +40,18 @@ class ParticipantRole(str, Enum):
     OTHER = "OTHER"
 
 
+# Plain-string membership checks without going through EnumMeta
+PARTICIPANT_ROLE_VALUES = frozenset(role.value for role in ParticipantRole)
+
+
 # Shared properties
 class InvestmentParticipantBase(BaseModel):
     """Base investment participant schema with common fields."""
     funding_round_id: int = Field(..., description="ID of the funding round")
     investor_id: int = Field(..., description="ID of the investor")
     role: ParticipantRole = Field(..., description="Role of the participant in this round")
-    amount_invested: Decimal = Field(
+    amount_invested: OptUSDAmount = Field(
         None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
         description="Amount invested in USD (if known)"
     )
     is_lead: bool = Field(
@@ -47,7 +62,7 @@ class InvestmentParticipantBase(BaseModel):
         False, 
         description="Whether the lead status has been verified"
     )
-    ownership_percentage: Optional[Decimal] = Field(
+    ownership_percentage: Optional[FloatDecimal] = Field(
         None, 
         ge=0, 
         le=100, 
@@ -60,11 +75,8 @@ class InvestmentParticipantBase(BaseModel):
         ge=0, 
         description="Number of shares issued (if known)"
     )
-    price_per_share: Optional[Decimal] = Field(
+    price_per_share: Optional[SharePrice] = Field(
         None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=10,
         description="Price per share (if known)"
     )
     participation_date: Optional[date] = Field(
@@ -80,7 +92,7 @@ class InvestmentParticipantBase(BaseModel):
     @classmethod
     def validate_participation_date(cls, v: Optional[date]) -> Optional[date]:
         """Validate that participation date is not in the future."""
-        if v is not None and v > date.today():
+        if v is not None and v > cached_today():
             raise ValueError("participation_date cannot be in the future")
         return v
 
@@ -92,75 +104,28 @@ class InvestmentParticipantCreate(InvestmentParticipantBase):
 
 
 # Properties to receive on investment participant update
-class InvestmentParticipantUpdate(BaseModel):
-    """Schema for updating an existing investment participant."""
-    role: Optional[ParticipantRole] = Field(
-        None, 
-        description="Role of the participant in this round"
-    )
-    amount_invested: Optional[Decimal] = Field(
-        None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=2,
-        description="Amount invested in USD (if known)"
-    )
-    is_lead: Optional[bool] = Field(
-        None, 
-        description="Whether this participant is the lead investor"
-    )
-    is_lead_checked: Optional[bool] = Field(
-        None, 
-        description="Whether the lead status has been verified"
-    )
-    ownership_percentage: Optional[Decimal] = Field(
-        None, 
-        ge=0, 
-        le=100, 
-        max_digits=5, 
-        decimal_places=2,
-        description="Ownership percentage (if known)"
-    )
-    shares_issued: Optional[int] = Field(
-        None, 
-        ge=0, 
-        description="Number of shares issued (if known)"
-    )
-    price_per_share: Optional[Decimal] = Field(
-        None, 
-        gt=0, 
-        max_digits=20, 
-        decimal_places=10,
-        description="Price per share (if known)"
-    )
-    participation_date: Optional[date] = Field(
-        None, 
-        description="Date when the investment was made"
-    )
-    notes: Optional[str] = Field(
-        None, 
-        description="Additional notes about this participation"
-    )
+InvestmentParticipantUpdate = make_partial(
+    InvestmentParticipantCreate,
+    'InvestmentParticipantUpdate',
+    exclude=('funding_round_id', 'investor_id'),
+    doc="Schema for updating an existing investment participant.",
+)
 
 
 # Properties shared by models stored in DB
 class InvestmentParticipantInDBBase(IDSchemaMixin, TimestampMixin, InvestmentParticipantBase):
     """Base schema for investment participant data stored in the database."""
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            Decimal: lambda v: float(v) if v is not None else None
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Properties to return to client
 class InvestmentParticipant(InvestmentParticipantInDBBase):
     """Investment participant schema for API responses."""
-    pass
+    model_config = RESPONSE_CONFIG
 
 
 # Properties stored in DB
-class InvestmentParticipantInDB(InvestmentParticipantInDBBase):
+class InvestmentParticipantInDB(TrustedORMMixin, InvestmentParticipantInDBBase):
     """Investment participant schema for database operations."""
     pass
 
@@ -168,8 +133,8 @@ class InvestmentParticipantInDB(InvestmentParticipantInDBBase):
 # Additional properties to return via API
 class InvestmentParticipantWithRelations(InvestmentParticipant):
     """Investment participant schema with related entities."""
-    investor: Optional[dict] = Field(None, description="Investor details")
-    funding_round: Optional[dict] = Field(
+    investor: Optional[Any] = Field(None, description="Investor details")
+    funding_round: Optional[Any] = Field(
         None, 
         description="Funding round details"
     )
@@ -178,6 +143,8 @@ class InvestmentParticipantWithRelations(InvestmentParticipant):
 # Request/Response models for investment participant operations
 class InvestmentParticipantResponse(BaseModel):
     """Generic investment participant operation response."""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool = Field(..., description="Operation status")
     message: str = Field(..., description="Result message")
     participant: Optional[InvestmentParticipant] = Field(
@@ -188,6 +155,8 @@ class InvestmentParticipantResponse(BaseModel):
 
 class InvestmentParticipantsResponse(BaseModel):
     """Response for listing multiple investment participants."""
+    model_config = RESPONSE_CONFIG
+
     success: bool = Field(..., description="Operation status")
     count: int = Field(..., description="Number of participants")
     participants: List[InvestmentParticipant] = Field(
@@ -199,15 +168,28 @@ class InvestmentParticipantsResponse(BaseModel):
 # Request/Response models for bulk operations
 class InvestmentParticipantBulkCreate(BaseModel):
     """Schema for bulk creating investment participants."""
+    model_config = ConfigDict(defer_build=True)
+
     participants: List[InvestmentParticipantCreate] = Field(
         ..., 
         description="List of participants to create"
     )
 
 
+# Validates a whole batch of raw investment participant payloads in a single call
+INVESTMENT_PARTICIPANT_LIST_ADAPTER = TypeAdapter(List[InvestmentParticipantCreate])
+
+
+class InvestmentParticipantBulkUpdateItem(InvestmentParticipantUpdate):
+    """Single investment participant update within a bulk update."""
+    id: int = Field(..., description="Investment participant ID")
+
+
 class InvestmentParticipantBulkUpdate(BaseModel):
     """Schema for bulk updating investment participants."""
-    participants: List[dict] = Field(
+    model_config = ConfigDict(defer_build=True)
+
+    participants: List[InvestmentParticipantBulkUpdateItem] = Field(
         ..., 
         description="List of participant updates with IDs"
     )
@@ -216,6 +198,8 @@ class InvestmentParticipantBulkUpdate(BaseModel):
 # Search and filter models
 class InvestmentParticipantFilters(BaseModel):
     """Filters for querying investment participants."""
+    model_config = ConfigDict(defer_build=True)
+
     funding_round_id: Optional[int] = Field(
         None, 
         description="Filter by funding round ID"
@@ -232,14 +216,12 @@ class InvestmentParticipantFilters(BaseModel):
         None, 
         description="Filter by lead investor status"
     )
-    min_amount: Optional[Decimal] = Field(
+    min_amount: Optional[PositiveDecimal] = Field(
         None, 
-        gt=0, 
         description="Minimum amount invested"
     )
-    max_amount: Optional[Decimal] = Field(
+    max_amount: Optional[PositiveDecimal] = Field(
         None, 
-        gt=0, 
         description="Maximum amount invested"
     )
     min_ownership: Optional[Decimal] = Field(
@@ -255,32 +237,23 @@ class InvestmentParticipantFilters(BaseModel):
         description="Maximum ownership percentage"
     )
     
-    @field_validator('max_amount')
-    @classmethod
-    def validate_amount_range(
-        cls, 
-        v: Optional[Decimal], 
-        values: dict
-    ) -> Optional[Decimal]:
-        """Validate that max_amount is greater than min_amount if both are provided."""
-        if v is not None and 'min_amount' in values and values['min_amount'] is not None:
-            if v < values['min_amount']:
-                raise ValueError(
-                    "max_amount must be greater than or equal to min_amount"
-                )
-        return v
-    
-    @field_validator('max_ownership')
-    @classmethod
-    def validate_ownership_range(
-        cls, 
-        v: Optional[Decimal], 
-        values: dict
-    ) -> Optional[Decimal]:
-        """Validate that max_ownership is greater than min_ownership if both are provided."""
-        if v is not None and 'min_ownership' in values and values['min_ownership'] is not None:
-            if v < values['min_ownership']:
-                raise ValueError(
-                    "max_ownership must be greater than or equal to min_ownership"
-                )
-        return v
+    @model_validator(mode='after')
+    def validate_ranges(self) -> 'InvestmentParticipantFilters':
+        """Validate that each max/end bound is not below its min/start bound."""
+        if (
+            self.max_amount is not None
+            and self.min_amount is not None
+            and self.max_amount < self.min_amount
+        ):
+            raise ValueError(
+                "max_amount must be greater than or equal to min_amount"
+            )
+        if (
+            self.max_ownership is not None
+            and self.min_ownership is not None
+            and self.max_ownership < self.min_ownership
+        ):
+            raise ValueError(
+                "max_ownership must be greater than or equal to min_ownership"
+            )
+        return self
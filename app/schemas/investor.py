@@ -3,9 +3,12 @@ from datetime import date
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl, field_validator
+from pydantic import BaseModel, EmailStr, Field, HttpUrl, model_validator
 
-from app.schemas.base import IDSchemaMixin, TimestampMixin
+from app.schemas.base import IDSchemaMixin, TimestampMixin, TwitterHandle, make_partial
+
+# Upper bound for founded_year, fixed when the module is imported
+_CURRENT_YEAR = date.today().year
 
 
 class InvestorType(str, Enum):
@@ -47,9 +50,7 @@ class InvestmentStage(str, Enum):
     POST_IPO_DEBT = "POST_IPO_DEBT"
     POST_IPO_EQUITY = "POST_IPO_EQUITY"
     POST_IPO_SECONDARY = "POST_IPO_SECONDARY"
-    PRE_SEED = "PRE_SEED"
     SECONDARY_MARKET = "SECONDARY_MARKET"
-    SEED = "SEED"
     VENTURE = "VENTURE"
 
 
@@ -63,7 +64,7 @@ class InvestorBase(BaseModel):
     founded_year: Optional[int] = Field(
         None, 
         ge=1800, 
-        le=date.today().year,
+        le=_CURRENT_YEAR,
         description="Year the investor was founded"
     )
     headquarters: Optional[str] = Field(
@@ -79,7 +80,7 @@ class InvestorBase(BaseModel):
         None, 
         description="LinkedIn profile URL"
     )
-    twitter_handle: Optional[str] = Field(
+    twitter_handle: Optional[TwitterHandle] = Field(
         None, 
         max_length=50, 
         description="Twitter username (without @)"
@@ -102,23 +103,6 @@ class InvestorBase(BaseModel):
         None, 
         description="List of preferred industries"
     )
-    
-    @field_validator('twitter_handle')
-    @classmethod
-    def clean_twitter_handle(cls, v: Optional[str]) -> Optional[str]:
-        """Clean and validate Twitter handle."""
-        if not v:
-            return v
-        # Remove @ symbol if present
-        return v.lstrip('@')
-    
-    @field_validator('founded_year')
-    @classmethod
-    def validate_founded_year(cls, v: Optional[int]) -> Optional[int]:
-        """Validate that founded year is not in the future."""
-        if v is not None and v > date.today().year:
-            raise ValueError("founded_year cannot be in the future")
-        return v
 
 
 # Properties to receive on investor creation
@@ -128,54 +112,11 @@ class InvestorCreate(InvestorBase):
 
 
 # Properties to receive on investor update
-class InvestorUpdate(BaseModel):
-    """Schema for updating an existing investor."""
-    name: Optional[str] = Field(None, max_length=255, description="Investor name")
-    investor_type: Optional[InvestorType] = Field(None, description="Type of investor")
-    description: Optional[str] = Field(None, description="Investor description")
-    website: Optional[HttpUrl] = Field(None, description="Investor website URL")
-    founded_year: Optional[int] = Field(
-        None, 
-        ge=1800, 
-        le=date.today().year,
-        description="Year the investor was founded"
-    )
-    headquarters: Optional[str] = Field(
-        None, 
-        max_length=255, 
-        description="Investor headquarters location"
-    )
-    contact_email: Optional[EmailStr] = Field(
-        None, 
-        description="Contact email address"
-    )
-    linkedin_url: Optional[HttpUrl] = Field(
-        None, 
-        description="LinkedIn profile URL"
-    )
-    twitter_handle: Optional[str] = Field(
-        None, 
-        max_length=50, 
-        description="Twitter username (without @)"
-    )
-    total_investments: Optional[int] = Field(
-        None, 
-        ge=0, 
-        description="Total number of investments made"
-    )
-    total_funding: Optional[float] = Field(
-        None, 
-        ge=0, 
-        description="Total funding amount in USD"
-    )
-    investment_stages: Optional[List[InvestmentStage]] = Field(
-        None, 
-        description="List of investment stages"
-    )
-    preferred_industries: Optional[List[str]] = Field(
-        None, 
-        description="List of preferred industries"
-    )
+InvestorUpdate = make_partial(
+    InvestorCreate,
+    'InvestorUpdate',
+    doc="Schema for updating an existing investor.",
+)
 
 
 # Properties shared by models stored in DB
@@ -272,32 +213,23 @@ class InvestorFilters(BaseModel):
         description="Filter by preferred industry"
     )
     
-    @field_validator('max_investments')
-    @classmethod
-    def validate_investments_range(
-        cls, 
-        v: Optional[int], 
-        values: dict
-    ) -> Optional[int]:
-        """Validate that max_investments is greater than min_investments if both are provided."""
-        if v is not None and 'min_investments' in values and values['min_investments'] is not None:
-            if v < values['min_investments']:
-                raise ValueError(
-                    "max_investments must be greater than or equal to min_investments"
-                )
-        return v
-    
-    @field_validator('max_funding')
-    @classmethod
-    def validate_funding_range(
-        cls, 
-        v: Optional[float], 
-        values: dict
-    ) -> Optional[float]:
-        """Validate that max_funding is greater than min_funding if both are provided."""
-        if v is not None and 'min_funding' in values and values['min_funding'] is not None:
-            if v < values['min_funding']:
-                raise ValueError(
-                    "max_funding must be greater than or equal to min_funding"
-                )
-        return v
+    @model_validator(mode='after')
+    def validate_ranges(self) -> 'InvestorFilters':
+        """Validate that each max bound is not below its min bound."""
+        if (
+            self.max_investments is not None
+            and self.min_investments is not None
+            and self.max_investments < self.min_investments
+        ):
+            raise ValueError(
+                "max_investments must be greater than or equal to min_investments"
+            )
+        if (
+            self.max_funding is not None
+            and self.min_funding is not None
+            and self.max_funding < self.min_funding
+        ):
+            raise ValueError(
+                "max_funding must be greater than or equal to min_funding"
+            )
+        return self
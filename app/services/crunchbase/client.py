@@ -6,6 +6,8 @@ from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timedelta
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -20,11 +22,47 @@ from .exceptions import (
     CrunchbaseAuthError,
     CrunchbaseNotFoundError,
 )
-from .models import Company, FundingRound, CrunchbaseResponse
-from .config import CrunchbaseConfig
+from .models import Company, FundingRound, Investor, CrunchbaseResponse, parse_crunchbase_date
+from .config import CrunchbaseConfig, get_crunchbase_config
 
 logger = logging.getLogger(__name__)
 
+_COMPANY_DATE_FIELDS = ('founded_on', 'last_funding_at', 'created_at', 'updated_at')
+_ROUND_DATE_FIELDS = ('announced_on', 'created_at', 'updated_at')
+
+# Built once at import; validating a whole list is a single pydantic-core call
+_COMPANY_ADAPTER = TypeAdapter(Company)
+_ROUNDS_ADAPTER = TypeAdapter(List[FundingRound])
+
+
+def _construct(model, fields: Dict[str, Any], date_fields):
+    """Build a model from trusted API fields, only parsing its date fields."""
+    fields = dict(fields)
+    for name in date_fields:
+        if name in fields:
+            fields[name] = parse_crunchbase_date(fields[name])
+    return model.model_construct(**fields)
+
+
+def _round_fields(round_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a funding round entity from the API into FundingRound fields."""
+    return {
+        "uuid": round_data.get("uuid"),
+        "name": round_data.get("name"),
+        "announced_on": round_data.get("announced_on"),
+        "money_raised": round_data.get("money_raised"),
+        "money_raised_currency": round_data.get("money_raised_currency"),
+        "investors": [
+            {
+                "uuid": inv.get("uuid"),
+                "name": inv.get("name"),
+                "type": inv.get("type")
+            }
+            for inv in round_data.get("investments", [])
+        ]
+    }
+
+
 class CrunchbaseClient:
     """Client for interacting with the Crunchbase API."""
     
@@ -36,9 +74,18 @@ class CrunchbaseClient:
         Args:
             config: Crunchbase configuration. If not provided, will be loaded from environment.
         """
-        self.config = config or CrunchbaseConfig()
-        self._last_request_time = 0
-        self._min_request_interval = 1.0 / self.config.requests_per_second
+        self.config = config or get_crunchbase_config()
+        # Crunchbase payloads are trusted and built with model_construct unless
+        # CRUNCHBASE_VALIDATE_RESPONSES asks for full validation
+        self._validate_responses = self.config.validate_responses
+        # Token bucket: bursts of up to requests_per_second requests, refilled
+        # continuously at requests_per_second
+        self._rate = self.config.requests_per_second
+        self._capacity = max(1.0, self._rate)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        # Created on first use so it binds to the loop the client runs on
+        self._rate_lock: Optional[asyncio.Lock] = None
         self._session = self._create_session()
     
     def _create_session(self) -> httpx.AsyncClient:
@@ -58,15 +105,43 @@ class CrunchbaseClient:
             ),
         )
     
+    def _build_company(self, raw: bytes) -> Company:
+        """Build a Company from a raw API response body."""
+        if self._validate_responses:
+            return _COMPANY_ADAPTER.validate_json(raw)
+        return _construct(Company, orjson.loads(raw), _COMPANY_DATE_FIELDS)
+    
+    def _build_round(self, fields: Dict[str, Any]) -> FundingRound:
+        """Build a FundingRound from fields shaped by _round_fields."""
+        if self._validate_responses:
+            return FundingRound(**fields)
+        fields["investors"] = [Investor.model_construct(**inv) for inv in fields["investors"]]
+        return _construct(FundingRound, fields, _ROUND_DATE_FIELDS)
+    
+    def _build_rounds(self, rounds_data: List[Dict[str, Any]]) -> List[FundingRound]:
+        """Build FundingRounds from a list of funding round entities."""
+        shaped = [_round_fields(round_data) for round_data in rounds_data]
+        if self._validate_responses:
+            return _ROUNDS_ADAPTER.validate_python(shaped)
+        return [self._build_round(fields) for fields in shaped]
+    
     async def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests."""
-        now = time.time()
-        time_since_last = now - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            sleep_time = self._min_request_interval - time_since_last
-            logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
-            await asyncio.sleep(sleep_time)
-        self._last_request_time = time.time()
+        """Take a token from the rate limit bucket, waiting for one if empty."""
+        if self._rate_lock is None:
+            # On Python 3.9 a Lock binds to the loop current at construction,
+            # which may not be the loop that later awaits it
+            self._rate_lock = asyncio.Lock()
+        async with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                sleep_time = (1 - self._tokens) / self._rate
+                logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
+                await asyncio.sleep(sleep_time)
+                self._tokens = 1
+                self._last_refill = time.monotonic()
+            self._tokens -= 1
     
     @retry(
         stop=stop_after_attempt(3),
@@ -78,8 +153,12 @@ class CrunchbaseClient:
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
-        """Make an HTTP request to the Crunchbase API with rate limiting."""
+    async def _request_bytes(self, method: str, endpoint: str, **kwargs) -> bytes:
+        """Make an HTTP request to the Crunchbase API with rate limiting.
+        
+        Returns the raw response body so it can be parsed and validated in a
+        single pass.
+        """
         await self._enforce_rate_limit()
         
         url = f"{self.BASE_URL.rstrip('/')}/{endpoint.lstrip('/')}"
@@ -88,7 +167,7 @@ class CrunchbaseClient:
         try:
             response = await self._session.request(method, url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return response.content
                 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -98,7 +177,7 @@ class CrunchbaseClient:
             elif e.response.status_code == 429:
                 retry_after = int(e.response.headers.get("Retry-After", 5))
                 logger.warning("Rate limited. Waiting %s seconds", retry_after)
-                time.sleep(retry_after)
+                await asyncio.sleep(retry_after)
                 raise CrunchbaseRateLimitError("Rate limit exceeded") from e
             else:
                 raise CrunchbaseAPIError(
@@ -108,6 +187,10 @@ class CrunchbaseClient:
         except httpx.RequestError as e:
             raise CrunchbaseAPIError(f"Request failed: {str(e)}") from e
     
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Make an HTTP request to the Crunchbase API and decode the JSON body."""
+        return orjson.loads(await self._request_bytes(method, endpoint, **kwargs))
+    
     async def get_company(self, identifier: str) -> Optional[Company]:
         """Get company details by permalink or UUID.
         
@@ -126,8 +209,8 @@ class CrunchbaseClient:
                 ]
             }
             
-            data = await self._request("GET", endpoint, params=params)
-            return Company(**data)
+            raw = await self._request_bytes("GET", endpoint, params=params)
+            return self._build_company(raw)
             
         except CrunchbaseNotFoundError:
             return None
@@ -153,24 +236,7 @@ class CrunchbaseClient:
         
         # Extract and normalize funding rounds
         rounds_data = response.get("entities", [])
-        return [
-            FundingRound(
-                uuid=round_data.get("uuid"),
-                name=round_data.get("name"),
-                announced_on=round_data.get("announced_on"),
-                money_raised=round_data.get("money_raised"),
-                money_raised_currency=round_data.get("money_raised_currency"),
-                investors=[
-                    {
-                        "uuid": inv.get("uuid"),
-                        "name": inv.get("name"),
-                        "type": inv.get("type")
-                    }
-                    for inv in round_data.get("investments", [])
-                ]
-            )
-            for round_data in rounds_data
-        ]
+        return self._build_rounds(rounds_data)
         
     async def get_funding_round_details(self, round_id: str) -> Optional[FundingRound]:
         """Get detailed information about a specific funding round.
@@ -189,25 +255,14 @@ class CrunchbaseClient:
         try:
             round_data = await self._request("GET", endpoint)
             
-            return FundingRound(
-                uuid=round_data.get("uuid"),
-                name=round_data.get("name"),
-                announced_on=round_data.get("announced_on"),
-                money_raised=round_data.get("money_raised"),
-                money_raised_currency=round_data.get("money_raised_currency"),
-                investors=[
-                    {
-                        "uuid": inv.get("uuid"),
-                        "name": inv.get("name"),
-                        "type": inv.get("type")
-                    }
-                    for inv in round_data.get("investments", [])
-                ],
+            fields = _round_fields(round_data)
+            fields.update(
                 source_url=round_data.get("source_url"),
                 source_description=round_data.get("source_description"),
                 created_at=round_data.get("created_at"),
                 updated_at=round_data.get("updated_at")
             )
+            return self._build_round(fields)
         except CrunchbaseNotFoundError:
             return None
             
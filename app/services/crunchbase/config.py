@@ -1,4 +1,6 @@
 """Configuration for the Crunchbase API client."""
+from functools import lru_cache
+
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
 from typing import Optional
@@ -21,6 +23,9 @@ class CrunchbaseConfig(BaseSettings):
     # Caching
     cache_ttl: int = 3600  # 1 hour in seconds
     
+    # Debugging
+    validate_responses: bool = False  # Fully validate API payloads (e.g. in CI)
+    
     class Config:
         env_prefix = "CRUNCHBASE_"
         case_sensitive = False
@@ -37,6 +42,11 @@ class CrunchbaseConfig(BaseSettings):
             raise ValueError("max_retries must be between 0 and 5")
         return v
 
+@lru_cache()
 def get_crunchbase_config() -> CrunchbaseConfig:
-    """Get the Crunchbase configuration."""
+    """Get the Crunchbase configuration.
+    
+    The configuration is read from the environment once and cached; call
+    ``get_crunchbase_config.cache_clear()`` to pick up changes.
+    """
     return CrunchbaseConfig()
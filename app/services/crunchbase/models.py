@@ -3,6 +3,15 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, HttpUrl, Field, validator
 from datetime import date
 
+def parse_crunchbase_date(v):
+    """Parse an ISO date or datetime string from the API into a date."""
+    if isinstance(v, str):
+        try:
+            return date.fromisoformat(v.split('T')[0])
+        except (ValueError, AttributeError):
+            return None
+    return v
+
 class Investor(BaseModel):
     """Model representing an investor in a funding round."""
     name: str
@@ -39,12 +48,7 @@ class FundingRound(BaseModel):
     
     @validator('announced_on', 'created_at', 'updated_at', pre=True)
     def parse_date(cls, v):
-        if isinstance(v, str):
-            try:
-                return date.fromisoformat(v.split('T')[0])
-            except (ValueError, AttributeError):
-                return None
-        return v
+        return parse_crunchbase_date(v)
 
 class Company(BaseModel):
     """Model representing a company from Crunchbase."""
@@ -67,12 +71,7 @@ class Company(BaseModel):
     
     @validator('founded_on', 'last_funding_at', 'created_at', 'updated_at', pre=True)
     def parse_dates(cls, v):
-        if isinstance(v, str):
-            try:
-                return date.fromisoformat(v.split('T')[0])
-            except (ValueError, AttributeError):
-                return None
-        return v
+        return parse_crunchbase_date(v)
 
 class CrunchbaseResponse(BaseModel):
     """Base response model for Crunchbase API."""
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import httpx
@@ -86,3 +87,13 @@ class AirtableUpdater(BaseUpdater):
         except Exception as e:
             logger.error(f"Unexpected error updating Airtable record {company_id}: {e}")
             raise
+
+
+@lru_cache()
+def get_airtable_updater() -> AirtableUpdater:
+    """Get the process-wide Airtable updater instance.
+
+    Returns:
+        The shared Airtable updater.
+    """
+    return AirtableUpdater()
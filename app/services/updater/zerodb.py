@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -318,3 +319,13 @@ class ZeroDBUpdater(BaseUpdater):
         """
         logger.info(f"Cache invalidation requested for {len(company_ids)} companies")
         return {"success": True, "message": "ZeroDB handles caching internally"}
+
+
+@lru_cache()
+def get_zerodb_updater() -> ZeroDBUpdater:
+    """Get the process-wide ZeroDB updater instance.
+
+    Returns:
+        The shared ZeroDB updater.
+    """
+    return ZeroDBUpdater()
@@ -12,6 +12,7 @@ setup(
         "uvicorn[standard]>=0.15.0,<0.16.0",
         "pydantic>=1.8.0,<2.0.0",
         "python-dotenv>=0.19.0,<0.20.0",
+        "orjson>=3.9.0,<4.0.0",
         "sqlalchemy>=1.4.0,<2.0.0",
         "alembic>=1.7.0,<2.0.0",
         "psycopg2-binary>=2.9.0,<3.0.0",
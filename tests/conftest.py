@@ -72,6 +72,26 @@ def setup_test_environment():
 
 # Import after setting up environment
 from fastapi.testclient import TestClient
+from sqlalchemy import CheckConstraint, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+
+
+# Postgres-only DDL rendered for the in-memory SQLite database used by
+# ``db_session``
+@compiles(JSONB, 'sqlite')
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    return 'JSON'
+
+
+@compiles(CheckConstraint, 'sqlite')
+def _compile_check_sqlite(constraint, compiler, **kw):
+    # Regex format checks use the Postgres ``~`` operator
+    if '~' in str(constraint.sqltext):
+        return None
+    return compiler.visit_check_constraint(constraint, **kw)
 
 # This will be imported after mocking is set up
 @pytest.fixture
@@ -87,6 +107,26 @@ def client(app):
     with TestClient(app) as test_client:
         yield test_client
 
+@pytest.fixture
+def db_session():
+    """Session on an in-memory SQLite database holding the model tables.
+
+    Only the tables are created; the Postgres-specific indexes are skipped.
+    """
+    from app.db.session import Base
+    import app.models  # noqa: F401
+
+    engine = create_engine('sqlite://')
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(CreateTable(table))
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
 @pytest.fixture
 def mock_redis():
     """Mock Redis client."""
@@ -1,4 +1,6 @@
 """Tests for the Crunchbase API client."""
+import asyncio
+
 import pytest
 import httpx
 import respx
@@ -175,3 +177,37 @@ async def test_rate_limiting(mock_config):
         # Should take at least 2 seconds (1 second between each of 3 requests)
         assert end_time - start_time >= 2.0
         assert route.call_count == 3
+
+
+def test_token_bucket_allows_bursts_up_to_capacity():
+    """A full bucket serves requests_per_second calls at once, then waits for a refill."""
+    config = CrunchbaseConfig(api_key="test", requests_per_second=5)
+    client = CrunchbaseClient(config=config)
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    async def take(count):
+        for _ in range(count):
+            await client._enforce_rate_limit()
+
+    with patch("app.services.crunchbase.client.asyncio.sleep", fake_sleep):
+        asyncio.run(take(5))
+        assert sleeps == []
+        asyncio.run(take(1))
+
+    assert len(sleeps) == 1
+    assert 0 < sleeps[0] <= 1 / 5
+
+
+def test_rate_limit_lock_created_in_the_running_loop():
+    """The lock is built on first use, so one client works across event loops."""
+    config = CrunchbaseConfig(api_key="test", requests_per_second=10)
+    client = CrunchbaseClient(config=config)
+    assert client._rate_lock is None
+
+    asyncio.run(client._enforce_rate_limit())
+    asyncio.run(client._enforce_rate_limit())
+
+    assert client._rate_lock is not None
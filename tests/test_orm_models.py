@@ -0,0 +1,347 @@
+"""Tests for the SQLAlchemy models, run against in-memory SQLite."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Insert, Update, inspect
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.sql import ClauseElement
+
+from app.models.company import Company, _to_cents
+from app.models.founder import Founder
+from app.models.funding_round import FundingRound, RoundType
+from app.models.investment_participant import InvestmentParticipant, InvestmentType
+from app.models.investor import Investor
+
+
+def _round(**kwargs) -> FundingRound:
+    values = dict(id='round-1', company_id='company-1', round_type=RoundType.SEED)
+    values.update(kwargs)
+    return FundingRound(**values)
+
+
+def _add_round_with_participants(session, **kwargs) -> None:
+    session.add_all([
+        Investor(id='investor-1', name='Acme Ventures'),
+        Investor(id='investor-2', name='Beta Capital'),
+        _round(**kwargs),
+        InvestmentParticipant(round_id='round-1', investor_id='investor-1', amount=Decimal('250')),
+        InvestmentParticipant(round_id='round-1', investor_id='investor-2', amount=Decimal('750')),
+    ])
+    session.commit()
+
+
+def test_funding_round_to_dict_converts_fields():
+    """to_dict turns Decimals into floats, dates into ISO strings and enums into values."""
+    funding_round = _round(
+        raised_amount=Decimal('1500000.50'),
+        announced_date=date(2024, 3, 1),
+    )
+
+    result = funding_round.to_dict(include_relationships=False)
+
+    assert result['raised_amount'] == 1500000.5
+    assert result['announced_date'] == '2024-03-01'
+    assert result['closed_date'] is None
+    assert result['round_type'] == 'seed'
+    assert result['investment_stage'] is None
+    assert result['is_closed'] is False
+
+
+def test_funding_round_aggregates_are_deferred(db_session):
+    """total_raised and participant_count are aggregated in SQL and only loaded when asked for."""
+    _add_round_with_participants(db_session)
+    db_session.expunge_all()
+
+    funding_round = db_session.get(FundingRound, 'round-1')
+    assert 'total_raised' not in inspect(funding_round).dict
+    assert funding_round.total_raised == Decimal('1000')
+    assert funding_round.participant_count == 2
+
+    db_session.expunge_all()
+    loaded = db_session.scalars(FundingRound.serialization_query()).one()
+    assert inspect(loaded).dict['total_raised'] == Decimal('1000')
+    assert inspect(loaded).dict['participant_count'] == 2
+
+
+def test_funding_round_to_dict_after_session_get(db_session):
+    """A round loaded with session.get serializes without touching its participants."""
+    _add_round_with_participants(db_session, raised_amount=Decimal('1000'))
+    db_session.expunge_all()
+
+    funding_round = db_session.get(FundingRound, 'round-1')
+
+    result = funding_round.to_dict()
+    assert 'participants' not in result
+    assert result['total_raised'] == 1000.0
+    assert result['participant_count'] == 2
+    assert b'"participants"' not in funding_round.to_json_bytes()
+
+
+def test_participant_to_dict_nests_only_loaded_relations(db_session):
+    """include_related nests the investor and round only when they are already loaded."""
+    _add_round_with_participants(db_session)
+    db_session.expunge_all()
+
+    participant = db_session.get(InvestmentParticipant, ('round-1', 'investor-1'))
+    result = participant.to_dict()
+    assert 'investor' not in result
+    assert 'funding_round' not in result
+
+    db_session.expunge_all()
+    query = InvestmentParticipant.serialization_query(include_related=True).where(
+        InvestmentParticipant.investor_id == 'investor-1'
+    )
+    participant = db_session.scalars(query).one()
+    result = participant.to_dict(json_compatible=True)
+    assert result['investor']['name'] == 'Acme Ventures'
+    assert result['funding_round']['round_type'] == 'seed'
+
+
+def test_funding_round_to_dict_with_participants(db_session):
+    """serialization_query loads everything to_dict reads."""
+    _add_round_with_participants(db_session)
+    db_session.expunge_all()
+
+    funding_round = db_session.scalars(FundingRound.serialization_query()).one()
+
+    result = funding_round.to_dict()
+    assert [p['amount'] for p in result['participants']] == [250.0, 750.0]
+    assert result['participants'][0]['investor']['name'] == 'Acme Ventures'
+    assert funding_round.to_json_bytes()
+
+
+def _record_updates(monkeypatch, session) -> list:
+    """Capture UPDATE statements instead of running them.
+
+    SQLite has no jsonb ``||``; the statements are checked compiled for
+    Postgres instead. Everything else still executes.
+    """
+    statements = []
+    execute = session.execute
+
+    def record(statement, *args, **kwargs):
+        if isinstance(statement, Update):
+            statements.append(statement)
+            return None
+        return execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(session, 'execute', record)
+    return statements
+
+
+def test_founder_update_from_api_merges_external_ids_in_sql(db_session, monkeypatch):
+    """A persistent founder's new external_ids keys are merged with jsonb || in SQL."""
+    db_session.add(Founder(id='founder-1', first_name='Ada', last_name='Lovelace',
+                           external_ids={'crunchbase': 'ada'}))
+    db_session.commit()
+    founder = db_session.get(Founder, 'founder-1')
+    statements = _record_updates(monkeypatch, db_session)
+
+    founder.update_from_api({'external_ids': {'crunchbase': 'ada', 'linkedin': 'ada-l'}})
+
+    assert len(statements) == 1
+    compiled = statements[0].compile(dialect=postgresql.dialect())
+    assert 'coalesce(founders.external_ids' in str(compiled)
+    assert '||' in str(compiled)
+    assert {'linkedin': 'ada-l'} in compiled.params.values()
+    assert 'external_ids' not in inspect(founder).dict
+
+
+def test_founder_update_from_api_merges_external_ids_in_python():
+    """Repeated syncs of an unsaved founder merge external_ids into a plain dict."""
+    founder = Founder(id='founder-1', first_name='Ada', last_name='Lovelace',
+                      external_ids={'crunchbase': 'ada'})
+    founder.update_from_api({'external_ids': {'linkedin': 'ada-l'}})
+    founder.update_from_api({'external_ids': {'github': 'ada'}})
+
+    expected = {'crunchbase': 'ada', 'linkedin': 'ada-l', 'github': 'ada'}
+    assert founder.external_ids == expected
+    assert founder.to_dict()['external_ids'] == expected
+
+
+def test_founder_update_from_api_sets_sync_time(db_session):
+    """A changing sync stamps last_synced_at with a datetime; a no-op sync does not."""
+    db_session.add(Founder(id='founder-1', first_name='Ada', last_name='Lovelace'))
+    db_session.commit()
+    founder = db_session.get(Founder, 'founder-1')
+
+    founder.update_from_api({'first_name': 'Ada'})
+    assert founder.last_synced_at is None
+    assert not db_session.dirty
+
+    founder.update_from_api({'title': 'CEO'})
+    assert isinstance(founder.last_synced_at, datetime)
+    assert founder.last_synced_at.tzinfo is not None
+    assert founder.to_dict()['last_synced_at'] == founder.last_synced_at
+
+
+def test_to_cents_rounds_half_up():
+    """Amounts are converted through Decimal, so float artifacts do not leak in."""
+    assert _to_cents(None) is None
+    assert _to_cents(1.005) == 101
+    assert _to_cents(0.295) == 30
+    assert _to_cents('19.99') == 1999
+    assert _to_cents(Decimal('2.5')) == 250
+    assert _to_cents(1500000) == 150000000
+
+
+def test_company_funding_amounts_stored_as_cents():
+    company = Company(name='Acme')
+    company.total_funding = 1.005
+    company.last_funding_amount = Decimal('250000.50')
+
+    assert company.total_funding_cents == 101
+    assert company.total_funding == 1.01
+    assert company.last_funding_amount_cents == 25000050
+
+
+def test_founder_name_tracks_unflushed_edits(db_session):
+    """name joins the current name parts rather than the stored full_name."""
+    db_session.add(Founder(id='founder-1', first_name='Ada', last_name='Lovelace'))
+    db_session.commit()
+    founder = db_session.get(Founder, 'founder-1')
+    assert founder.full_name == 'Ada Lovelace'
+
+    founder.last_name = 'King'
+    assert founder.name == 'Ada King'
+
+
+def test_funding_round_participants_raise_on_sql(db_session):
+    """participants raises instead of lazy loading; serialization_query loads them eagerly."""
+    _add_round_with_participants(db_session)
+    db_session.expunge_all()
+
+    funding_round = db_session.get(FundingRound, 'round-1')
+    with pytest.raises(InvalidRequestError):
+        funding_round.participants
+
+    db_session.expunge_all()
+    funding_round = db_session.scalars(FundingRound.serialization_query()).one()
+    assert {p.investor.name for p in funding_round.participants} == {'Acme Ventures', 'Beta Capital'}
+
+
+def test_participant_relationships_raise_on_sql(db_session):
+    """The investor and funding round of a participant raise instead of lazy loading."""
+    _add_round_with_participants(db_session)
+    db_session.expunge_all()
+
+    participant = db_session.get(InvestmentParticipant, ('round-1', 'investor-1'))
+    with pytest.raises(InvalidRequestError):
+        participant.investor
+    with pytest.raises(InvalidRequestError):
+        participant.funding_round
+
+
+def test_update_from_api_assigns_no_sql_expressions(db_session, monkeypatch):
+    """Syncs leave plain Python values on the instance, never SQL expressions."""
+    db_session.add(Founder(id='founder-1', first_name='Ada', last_name='Lovelace'))
+    db_session.commit()
+    founder = db_session.get(Founder, 'founder-1')
+    _record_updates(monkeypatch, db_session)
+
+    founder.update_from_api({'title': 'CEO', 'external_ids': {'crunchbase': 'ada'}})
+
+    state = inspect(founder).dict
+    assert not [key for key, value in state.items() if isinstance(value, ClauseElement)]
+    assert founder.to_dict()['title'] == 'CEO'
+
+
+def _record_inserts(monkeypatch, session) -> list:
+    """Capture INSERT statements and their rows instead of running them.
+
+    The Postgres ``ON CONFLICT`` upserts cannot run on SQLite; they are
+    checked compiled for Postgres instead. Everything else still executes.
+    """
+    statements = []
+    execute = session.execute
+
+    def record(statement, *args, **kwargs):
+        if isinstance(statement, Insert):
+            statements.append((statement, args[0] if args else kwargs.get('params')))
+            return None
+        return execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(session, 'execute', record)
+    return statements
+
+
+def test_update_participants_validates_persisted_round_rows(db_session, monkeypatch):
+    """The upsert path coerces and validates participant fields like the ORM path."""
+    _add_round_with_participants(db_session)
+    funding_round = db_session.get(FundingRound, 'round-1')
+    statements = _record_inserts(monkeypatch, db_session)
+
+    funding_round.update_from_api({'participants': [{
+        'investor_id': 'investor-1',
+        'currency': 'usd',
+        'amount': 250.5,
+        'investment_type': 'primary',
+        'ownership_percentage': '12.5',
+        'external_ids': {'crunchbase': 'acme'},
+        'metadata': {'source': 'press'},
+    }]})
+
+    [(statement, rows)] = statements
+    [row] = rows
+    assert row['currency'] == 'USD'
+    assert row['amount'] == Decimal('250.5')
+    assert row['investment_type'] is InvestmentType.PRIMARY
+    assert row['ownership_percentage'] == 12.5
+    assert row['metadata'] == {'source': 'press'}
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert 'coalesce(investment_participants.external_ids' in sql
+    assert '||' in sql
+
+
+@pytest.mark.parametrize('field, value', [
+    ('ownership_percentage', 150),
+    ('currency', 'XXQ'),
+    ('investment_type', 'Primary'),
+])
+def test_update_participants_rejects_invalid_persisted_rows(db_session, monkeypatch, field, value):
+    _add_round_with_participants(db_session)
+    funding_round = db_session.get(FundingRound, 'round-1')
+    statements = _record_inserts(monkeypatch, db_session)
+
+    with pytest.raises(ValueError):
+        funding_round.update_from_api({'participants': [{'investor_id': 'investor-1', field: value}]})
+    assert statements == []
+
+
+def test_update_participants_builds_unsaved_round_participants():
+    """An unsaved round gets ORM participants that went through the same checks."""
+    funding_round = _round()
+
+    funding_round.update_from_api({'participants': [
+        {'investor_id': 'investor-1', 'currency': 'eur', 'metadata': {'source': 'press'}},
+    ]})
+
+    [participant] = funding_round.participants
+    assert participant.currency == 'EUR'
+    assert participant.metadata_ == {'source': 'press'}
+    with pytest.raises(ValueError):
+        _round().update_from_api({'participants': [{'investor_id': 'i', 'ownership_percentage': 150}]})
+
+
+def test_insert_many_from_api_validates_participant_rows(db_session, monkeypatch):
+    """Bulk ingest builds participant rows like _update_participants, before writing anything."""
+    statements = _record_inserts(monkeypatch, db_session)
+    payload = {'id': 'round-1', 'company_id': 'company-1', 'round_type': 'seed', 'participants': [
+        {'investor_id': 'investor-1', 'currency': 'gbp', 'amount': '10.25', 'external_ids': {'cb': 'x'}},
+    ]}
+
+    FundingRound.insert_many_from_api(db_session, [payload])
+
+    rows = statements[-1][1]
+    assert rows[0]['currency'] == 'GBP'
+    assert rows[0]['amount'] == Decimal('10.25')
+    assert '||' in str(statements[-1][0].compile(dialect=postgresql.dialect()))
+
+    statements.clear()
+    payload['participants'][0]['investment_type'] = 'Series A'
+    with pytest.raises(ValueError):
+        FundingRound.insert_many_from_api(db_session, [payload])
+    assert statements == []
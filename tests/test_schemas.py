@@ -0,0 +1,56 @@
+"""Tests for the API request and response schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.founder import FounderFilters, FounderUpdate
+from app.schemas.funding_round import FundingRoundUpdate
+from app.schemas.investment_participant import InvestmentParticipantUpdate
+from app.schemas.investor import InvestorUpdate
+
+
+def test_founder_filters_reject_negative_experience():
+    """min_experience keeps its ge=0 bound, so negative values still fail validation."""
+    assert FounderFilters(min_experience=0).min_experience == 0
+    with pytest.raises(ValidationError):
+        FounderFilters(min_experience=-1)
+
+
+@pytest.mark.parametrize('schema, fields', [
+    (FundingRoundUpdate, {
+        'round_type', 'investment_type', 'announced_date', 'raised_amount', 'valuation',
+        'pre_money_valuation', 'post_money_valuation', 'is_equity', 'is_debt', 'is_convertible',
+        'is_announced', 'source_url', 'source_name', 'notes', 'investor_ids',
+    }),
+    (InvestmentParticipantUpdate, {
+        'role', 'amount_invested', 'is_lead', 'is_lead_checked', 'ownership_percentage',
+        'shares_issued', 'price_per_share', 'participation_date', 'notes',
+    }),
+    (FounderUpdate, {
+        'first_name', 'last_name', 'email', 'linkedin_url', 'twitter_handle', 'bio', 'photo_url',
+        'is_current', 'role', 'title', 'start_date', 'end_date', 'company_id',
+    }),
+    (InvestorUpdate, {
+        'name', 'investor_type', 'description', 'website', 'founded_year', 'headquarters',
+        'contact_email', 'linkedin_url', 'twitter_handle', 'total_investments', 'total_funding',
+        'investment_stages', 'preferred_industries',
+    }),
+])
+def test_update_schemas_accept_the_same_fields(schema, fields):
+    """PATCH schemas accept exactly the fields of the original hand-written Update models."""
+    assert set(schema.model_fields) == fields
+    assert all(not info.is_required() for info in schema.model_fields.values())
+    assert schema().model_dump(exclude_unset=True) == {}
+
+
+def test_update_schemas_keep_constraints():
+    """Optional copies keep their constraints for non-null values."""
+    assert FundingRoundUpdate(raised_amount=None).raised_amount is None
+    with pytest.raises(ValidationError):
+        FundingRoundUpdate(raised_amount=-1)
+    with pytest.raises(ValidationError):
+        FundingRoundUpdate(source_name='x' * 300)
+    assert FounderUpdate(twitter_handle='@ada', company_id=3).model_dump(exclude_unset=True) == {
+        'twitter_handle': 'ada',
+        'company_id': 3,
+    }